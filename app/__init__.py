@@ -104,6 +104,19 @@ def create_app():
             health_status['status'] = 'degraded'
             health_status['checks']['redis'] = {'status': 'down', 'error': str(e)}
         
+        # Check upstream NFL API circuit breakers
+        try:
+            from app.services.api_client import get_client
+            circuits = get_client().health()
+            if circuits['api'] == 'open':
+                health_status['status'] = 'degraded'
+            health_status['checks']['nfl_api'] = {
+                'status': 'down' if circuits['api'] == 'open' else 'up',
+                'circuits': circuits
+            }
+        except Exception as e:
+            health_status['checks']['nfl_api'] = {'status': 'unknown', 'error': str(e)}
+        
         # Response time
         health_status['response_time_ms'] = round((time.time() - start_time) * 1000, 2)
         
@@ -118,13 +131,22 @@ def create_app():
         from app.utils.cache import get_cache_stats
         return jsonify(get_cache_stats())
     
+    # Upstream NFL API request metrics
+    @app.route('/api/metrics/nfl-api')
+    def nfl_api_metrics():
+        from app.services.api_client import get_client
+        return jsonify(get_client().request_metrics())
+    
     # Cache invalidation endpoints
     @app.route('/api/cache/invalidate/player/<player_id>', methods=['POST'])
     def invalidate_player(player_id):
         """Invalidate cache for a specific player"""
         from app.utils.cache import invalidate_player_cache
+        from app.services.api_client import get_client
         try:
             invalidate_player_cache(player_id)
+            # Also forget a remembered "not found" so the player is fetched again
+            get_client().invalidate_missing(player_id)
             return jsonify({'message': f'Cache invalidated for player {player_id}', 'success': True})
         except Exception as e:
             logger.error(f"Failed to invalidate player cache: {e}")
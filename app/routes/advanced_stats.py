@@ -372,19 +372,20 @@ def get_enhanced_player_analysis(player_id):
         if not opponent:
             return jsonify({'error': 'opponent parameter required'}), 400
 
-        # Get player data
-        player_data = api_client.get_player_data(player_id)
+        # The three lookups are independent, so fetch them concurrently
+        # instead of paying one round trip after another
+        player_data, advanced_stats, defense_stats = api_client.fetch_many([
+            (api_client.get_player_data, (player_id,), {}),
+            (api_client.get_player_advanced_stats, (player_id,), {'season': season, 'week': week}),
+            (api_client.get_defense_rankings_v2, (), {'category': 'overall', 'season': season}),
+        ])
+
         if not player_data:
             return jsonify({'error': 'Player not found'}), 404
 
         player_info = player_data.get('data', player_data)
         position = player_info.get('position')
 
-        # Get advanced stats
-        advanced_stats = api_client.get_player_advanced_stats(player_id, season=season, week=week)
-
-        # Get defense advanced stats
-        defense_stats = api_client.get_defense_rankings_v2(category='overall', season=season)
         opponent_defense = next((d for d in defense_stats if d.get('team_abbr') == opponent), None)
 
         # Calculate advanced matchup score
@@ -34,11 +34,10 @@ def compare_players():
 
     try:
         comparisons = []
+        # Fetch all players concurrently rather than one round trip at a time
+        players = api_client.bulk_get_players(player_ids)
 
-        for i, player_id in enumerate(player_ids):
-            # Get player data
-            player = api_client.get_player_data(player_id)
-
+        for i, (player_id, player) in enumerate(zip(player_ids, players)):
             comparison_data = {
                 'player': player.get('data', player) if isinstance(player, dict) and 'data' in player else player,
                 'player_id': player_id
@@ -239,10 +238,11 @@ def export_comparison_csv():
         headers = ['Player Name', 'Position', 'Team', 'Opponent', 'Matchup Score', 'Recommendation']
         writer.writerow(headers)
 
-        # Get player data and write rows
+        # Get player data (fetched concurrently) and write rows
+        players = api_client.bulk_get_players(player_ids)
         for i, player_id in enumerate(player_ids):
             try:
-                player = api_client.get_player_data(player_id)
+                player = players[i]
                 player_data = player.get('data', player) if isinstance(player, dict) and 'data' in player else player
 
                 row = [
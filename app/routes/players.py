@@ -82,24 +82,16 @@ def analyze_player(player_id):
         return jsonify({'error': 'Query parameter "opponent" is required'}), 400
 
     try:
-        # Get player data
-        player = api_client.get_player_data(player_id)
-
-        # Get opponent defense stats
-        defense_stats = api_client.get_defense_stats(opponent)
-
-        # Get weather if location provided
-        weather = {}
-        if location:
-            try:
-                weather = api_client.get_weather_data(location)
-            except:
-                # Weather is optional, continue without it
-                pass
+        # Fetch player, career, defense and (optional) weather data concurrently
+        bundle = api_client.get_matchup_bundle(player_id, opponent, location)
+        player = bundle['player']
+        defense_stats = bundle['defense']
+        # Weather is optional, continue without it
+        weather = bundle['weather'] or {}
 
         # Get player career stats for grading
         try:
-            career_stats = api_client.get_player_career_stats(player_id)
+            career_stats = bundle['career']
             # Use most recent season or calculate average
             avg_points = career_stats.get('data', [{}])[0].get('fantasy_points', 10) if career_stats.get('data') else 10
         except:
@@ -30,27 +30,20 @@ def predict_player_performance(player_id):
         return jsonify({'error': 'Opponent team ID is required'}), 400
 
     try:
-        # Get player data
-        player = api_client.get_player_data(player_id)
+        # Fetch player, career, defense and (optional) weather data concurrently
+        bundle = api_client.get_matchup_bundle(player_id, opponent, location)
+        player = bundle['player']
 
         # Get historical performance
         try:
-            career_stats = api_client.get_player_career_stats(player_id)
+            career_stats = bundle['career']
             recent_stats = career_stats.get('data', [{}])[0] if career_stats.get('data') else {}
             avg_points = recent_stats.get('fantasy_points', 10)
         except:
             avg_points = 10
 
-        # Get defense stats
-        defense_stats = api_client.get_defense_stats(opponent)
-
-        # Get weather if location provided
-        weather = {}
-        if location:
-            try:
-                weather = api_client.get_weather_data(location)
-            except:
-                pass
+        defense_stats = bundle['defense']
+        weather = bundle['weather'] or {}
 
         # Calculate factors
         matchup_score = analyzer.calculate_matchup_score(player, defense_stats)
@@ -144,6 +137,10 @@ def predict_weekly_lineup():
     try:
         predictions = []
 
+        # Fetch every player with a matchup up front, concurrently
+        matched_ids = [player_id for player_id in roster if opponents.get(player_id)]
+        players = dict(zip(matched_ids, api_client.bulk_get_players(matched_ids)))
+
         for player_id in roster:
             opponent = opponents.get(player_id)
             if not opponent:
@@ -151,7 +148,7 @@ def predict_weekly_lineup():
 
             # Get player data
             try:
-                player = api_client.get_player_data(player_id)
+                player = players[player_id]
                 defense_stats = api_client.get_defense_stats(opponent)
 
                 # Quick prediction
@@ -1,6 +1,118 @@
 import numpy as np
 from sklearn.preprocessing import StandardScaler
 
+# Basic matchup score only depends on the defense rank, so precompute it for
+# every real rank (0-32); anything else falls back to the formula.
+_RANK_SCORE_TABLE = tuple(round(((32 - rank) / 32) * 100, 2) for rank in range(33))
+
+
+def _score_qb(player_advanced_stats, defense_advanced_stats):
+    """QB matchup analysis. Returns (score delta, factors)."""
+    delta = 0
+    factors = []
+
+    player_cpoe = player_advanced_stats.get('cpoe') or 0
+    player_epa = player_advanced_stats.get('epa_per_play') or 0
+    def_pressure_rate = defense_advanced_stats.get('pressure_rate', 30)
+    def_passer_rating_allowed = defense_advanced_stats.get('passer_rating_allowed', 95)
+    def_completion_pct_allowed = defense_advanced_stats.get('completion_pct_allowed', 65)
+
+    # QB excels in accuracy vs soft coverage
+    if player_cpoe > 2.0 and def_completion_pct_allowed > 67:
+        delta += 15
+        factors.append(f"Accuracy advantage vs soft coverage (CPOE: +{player_cpoe:.1f}%)")
+
+    # EPA efficiency vs defense allowing big plays
+    if player_epa > 0.15 and def_passer_rating_allowed > 100:
+        delta += 12
+        factors.append(f"Efficiency edge vs vulnerable defense (EPA: {player_epa:.2f})")
+
+    # Pressure concerns
+    if def_pressure_rate > 35:
+        delta -= 10
+        factors.append(f"Heavy pressure expected ({def_pressure_rate:.1f}% pressure rate)")
+    elif def_pressure_rate < 25:
+        delta += 8
+        factors.append(f"Clean pocket likely ({def_pressure_rate:.1f}% pressure rate)")
+
+    return delta, factors
+
+
+def _score_wr_te(player_advanced_stats, defense_advanced_stats):
+    """WR/TE matchup analysis. Returns (score delta, factors)."""
+    delta = 0
+    factors = []
+
+    player_separation = player_advanced_stats.get('avg_separation') or 0
+    player_target_share = player_advanced_stats.get('target_share') or 0
+    player_yac = player_advanced_stats.get('avg_yac') or 0
+    def_completion_allowed = defense_advanced_stats.get('completion_pct_allowed', 65)
+    def_yards_per_att_allowed = defense_advanced_stats.get('yards_per_attempt_allowed', 7.0)
+
+    # Route running vs coverage
+    if player_separation > 3.5 and def_completion_allowed > 67:
+        delta += 18
+        factors.append(f"Route running mismatch ({player_separation:.1f} yd separation vs soft coverage)")
+
+    # Target volume with favorable defense
+    if player_target_share > 23 and def_yards_per_att_allowed > 7.5:
+        delta += 14
+        factors.append(f"High volume vs generous defense ({player_target_share:.1f}% targets)")
+
+    # YAC ability vs defense allowing yards
+    if player_yac > 5.5 and def_yards_per_att_allowed > 7.2:
+        delta += 10
+        factors.append(f"YAC potential vs vulnerable coverage ({player_yac:.1f} YAC)")
+
+    return delta, factors
+
+
+def _score_rb(player_advanced_stats, defense_advanced_stats):
+    """RB matchup analysis. Returns (score delta, factors)."""
+    delta = 0
+    factors = []
+
+    player_yards_over_exp = player_advanced_stats.get('rush_yards_over_expected_per_att') or 0
+    player_success_rate = player_advanced_stats.get('success_rate') or 0
+    player_snap_share = player_advanced_stats.get('snap_share') or 0
+    def_stuff_rate = defense_advanced_stats.get('stuff_rate', 20)
+    def_rush_epa_allowed = defense_advanced_stats.get('epa_per_play_allowed', 0)
+    def_explosive_rate = defense_advanced_stats.get('explosive_play_rate_allowed', 15)
+
+    # Vision/elusiveness vs run defense
+    if player_yards_over_exp > 0.4 and def_stuff_rate < 20:
+        delta += 16
+        factors.append(f"Elite vision vs soft front ({player_yards_over_exp:.1f}+ yd over expected)")
+
+    # Workload with favorable defense
+    if player_snap_share > 65 and def_rush_epa_allowed > -0.05:
+        delta += 13
+        factors.append(f"Workhorse role vs vulnerable run D ({player_snap_share:.1f}% snaps)")
+
+    # Big play potential
+    if player_success_rate > 48 and def_explosive_rate > 16:
+        delta += 11
+        factors.append(f"Explosive play potential ({player_success_rate:.1f}% success vs {def_explosive_rate:.1f}% allowed)")
+
+    # Tough matchup
+    if def_stuff_rate > 24:
+        delta -= 12
+        factors.append(f"Stout run defense ({def_stuff_rate:.1f}% stuff rate)")
+
+    return delta, factors
+
+
+# Position -> advanced matchup scorer used by calculate_advanced_matchup_score.
+# Scorers bind player metrics once as numbers (missing/null -> 0), so their
+# threshold checks need no separate truthiness guard.
+POSITION_SCORERS = {
+    'QB': _score_qb,
+    'WR': _score_wr_te,
+    'TE': _score_wr_te,
+    'RB': _score_rb,
+}
+
+
 class PlayerAnalyzer:
     def __init__(self):
         self.scaler = StandardScaler()
@@ -51,6 +163,8 @@ class PlayerAnalyzer:
     def _compute_score(self, factors):
         """Compute matchup score from defense factors"""
         rank = factors.get('rank', 16)
+        if isinstance(rank, int) and 0 <= rank <= 32:
+            return _RANK_SCORE_TABLE[rank]
 
         # Higher rank (worse defense) = better matchup
         # Rank 1 (best defense) = lower score
@@ -80,84 +194,11 @@ class PlayerAnalyzer:
         
         matchup_score = 50  # Baseline
         factors = []
-        
-        # QB Matchup Analysis
-        if player_position == 'QB':
-            player_cpoe = player_advanced_stats.get('cpoe', 0)
-            player_epa = player_advanced_stats.get('epa_per_play', 0)
-            def_pressure_rate = defense_advanced_stats.get('pressure_rate', 30)
-            def_passer_rating_allowed = defense_advanced_stats.get('passer_rating_allowed', 95)
-            def_completion_pct_allowed = defense_advanced_stats.get('completion_pct_allowed', 65)
-            
-            # QB excels in accuracy vs soft coverage
-            if player_cpoe and player_cpoe > 2.0 and def_completion_pct_allowed > 67:
-                matchup_score += 15
-                factors.append(f"Accuracy advantage vs soft coverage (CPOE: +{player_cpoe:.1f}%)")
-            
-            # EPA efficiency vs defense allowing big plays
-            if player_epa and player_epa > 0.15 and def_passer_rating_allowed > 100:
-                matchup_score += 12
-                factors.append(f"Efficiency edge vs vulnerable defense (EPA: {player_epa:.2f})")
-            
-            # Pressure concerns
-            if def_pressure_rate > 35:
-                matchup_score -= 10
-                factors.append(f"Heavy pressure expected ({def_pressure_rate:.1f}% pressure rate)")
-            elif def_pressure_rate < 25:
-                matchup_score += 8
-                factors.append(f"Clean pocket likely ({def_pressure_rate:.1f}% pressure rate)")
-        
-        # WR/TE Matchup Analysis
-        elif player_position in ['WR', 'TE']:
-            player_separation = player_advanced_stats.get('avg_separation', 0)
-            player_target_share = player_advanced_stats.get('target_share', 0)
-            player_yac = player_advanced_stats.get('avg_yac', 0)
-            def_completion_allowed = defense_advanced_stats.get('completion_pct_allowed', 65)
-            def_yards_per_att_allowed = defense_advanced_stats.get('yards_per_attempt_allowed', 7.0)
-            
-            # Route running vs coverage
-            if player_separation and player_separation > 3.5 and def_completion_allowed > 67:
-                matchup_score += 18
-                factors.append(f"Route running mismatch ({player_separation:.1f} yd separation vs soft coverage)")
-            
-            # Target volume with favorable defense
-            if player_target_share and player_target_share > 23 and def_yards_per_att_allowed > 7.5:
-                matchup_score += 14
-                factors.append(f"High volume vs generous defense ({player_target_share:.1f}% targets)")
-            
-            # YAC ability vs defense allowing yards
-            if player_yac and player_yac > 5.5 and def_yards_per_att_allowed > 7.2:
-                matchup_score += 10
-                factors.append(f"YAC potential vs vulnerable coverage ({player_yac:.1f} YAC)")
-        
-        # RB Matchup Analysis
-        elif player_position == 'RB':
-            player_yards_over_exp = player_advanced_stats.get('rush_yards_over_expected_per_att', 0)
-            player_success_rate = player_advanced_stats.get('success_rate', 0)
-            player_snap_share = player_advanced_stats.get('snap_share', 0)
-            def_stuff_rate = defense_advanced_stats.get('stuff_rate', 20)
-            def_rush_epa_allowed = defense_advanced_stats.get('epa_per_play_allowed', 0)
-            def_explosive_rate = defense_advanced_stats.get('explosive_play_rate_allowed', 15)
-            
-            # Vision/elusiveness vs run defense
-            if player_yards_over_exp and player_yards_over_exp > 0.4 and def_stuff_rate < 20:
-                matchup_score += 16
-                factors.append(f"Elite vision vs soft front ({player_yards_over_exp:.1f}+ yd over expected)")
-            
-            # Workload with favorable defense
-            if player_snap_share and player_snap_share > 65 and def_rush_epa_allowed > -0.05:
-                matchup_score += 13
-                factors.append(f"Workhorse role vs vulnerable run D ({player_snap_share:.1f}% snaps)")
-            
-            # Big play potential
-            if player_success_rate and player_success_rate > 48 and def_explosive_rate > 16:
-                matchup_score += 11
-                factors.append(f"Explosive play potential ({player_success_rate:.1f}% success vs {def_explosive_rate:.1f}% allowed)")
-            
-            # Tough matchup
-            if def_stuff_rate > 24:
-                matchup_score -= 12
-                factors.append(f"Stout run defense ({def_stuff_rate:.1f}% stuff rate)")
+
+        scorer = POSITION_SCORERS.get(player_position)
+        if scorer:
+            delta, factors = scorer(player_advanced_stats, defense_advanced_stats)
+            matchup_score += delta
         
         # Cap score at 0-100
         matchup_score = max(0, min(100, matchup_score))
@@ -1,54 +1,818 @@
+import heapq
+import re
+import socket
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
 import os
 import logging
+from types import MappingProxyType
+from urllib.parse import urlsplit
+from app.utils.cache import cache_get_json, cache_set_json
+
+try:
+    # orjson parses the large /players payloads several times faster than stdlib json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    # rapidfuzz's bit-parallel C++ Levenshtein; the pure-Python DP below is the fallback
+    from rapidfuzz.distance.Levenshtein import distance as _rf_levenshtein
+except ImportError:
+    _rf_levenshtein = None
 
 logger = logging.getLogger(__name__)
 
+# API configuration is read once at import time (app/__init__.py loads .env
+# before any service module is imported) instead of on every instantiation.
+# Use API v2 by default, fallback to v1 if specified
+API_VERSION = os.getenv('API_VERSION', 'v2')
+API_BASE_URL = os.getenv('API_BASE_URL', f'https://nfl.wearemachina.com/api/{API_VERSION}')
+API_KEY = os.getenv('API_KEY')
+
+# Fallback tables used when the team endpoints are unavailable; read-only
+# module constants so a fallback lookup allocates nothing
+_DC_MAPPING_2024 = MappingProxyType({
+    'SF': 'Nick Sorensen',
+    'BAL': 'Zach Orr',
+    'BUF': 'Bobby Babich',
+    'DAL': 'Mike Zimmer',
+    'PIT': 'Teryl Austin',
+    'CLE': 'Jim Schwartz',
+    'NYJ': 'Jeff Ulbrich',
+    'KC': 'Steve Spagnuolo',
+    'PHI': 'Vic Fangio',
+    'MIA': 'Anthony Weaver',
+    'DET': 'Aaron Glenn',
+    'GB': 'Jeff Hafley',
+    'MIN': 'Brian Flores',
+    'HOU': 'Matt Burke'
+})
+
+_KEY_DEFENDERS_2024 = MappingProxyType({
+    'SF': {
+        'DL': ('Nick Bosa', 'Javon Hargrave'),
+        'LB': ('Fred Warner', 'Dre Greenlaw'),
+        'DB': ('Charvarius Ward', 'Talanoa Hufanga')
+    },
+    'BAL': {
+        'DL': ('Justin Madubuike',),
+        'LB': ('Roquan Smith', 'Kyle Van Noy'),
+        'DB': ('Marlon Humphrey', 'Kyle Hamilton')
+    },
+    'BUF': {
+        'DL': ('Ed Oliver', 'Von Miller'),
+        'LB': ('Terrel Bernard', 'Matt Milano'),
+        'DB': ('Tre\'Davious White', 'Jordan Poyer')
+    },
+    'DAL': {
+        'DL': ('Micah Parsons', 'DeMarcus Lawrence'),
+        'LB': ('Leighton Vander Esch',),
+        'DB': ('Trevon Diggs', 'DaRon Bland')
+    },
+    'PIT': {
+        'DL': ('T.J. Watt', 'Cameron Heyward'),
+        'LB': ('Alex Highsmith',),
+        'DB': ('Minkah Fitzpatrick', 'Patrick Peterson')
+    },
+    'KC': {
+        'DL': ('Chris Jones', 'George Karlaftis'),
+        'LB': ('Nick Bolton',),
+        'DB': ('Trent McDuffie', 'Justin Reid')
+    }
+})
+
+_DEFENSIVE_POSITION_GROUPS = MappingProxyType({
+    'DL': frozenset(('DE', 'DT', 'NT')),
+    'LB': frozenset(('LB', 'MLB', 'OLB', 'ILB')),
+    'DB': frozenset(('CB', 'S', 'SS', 'FS', 'DB'))
+})
+
+# urllib3 already disables Nagle (TCP_NODELAY); keepalive probes on top stop
+# NAT/load balancers silently dropping pooled connections between calls
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, 'TCP_KEEPIDLE'):
+    _SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30),
+    ]
+
+# backoff_jitter/backoff_max are Retry arguments from urllib3 2.x on
+_RETRY_HAS_JITTER = 'backoff_jitter' in Retry.__init__.__code__.co_varnames
+
+
+class _BoundedRetry(Retry):
+    """
+    Retry whose sleeps are bounded, for requests made inside Flask workers
+
+    Backoff sleeps are capped at DEFAULT_BACKOFF_MAX (BACKOFF_MAX before
+    urllib3 1.26.9), and a server's Retry-After is honored only up to
+    RETRY_AFTER_MAX seconds, so one 429 with a long Retry-After can't hold
+    a worker for minutes. These are class attributes because Retry.new()
+    builds a fresh instance for every retry.
+    """
+
+    DEFAULT_BACKOFF_MAX = BACKOFF_MAX = 30
+    RETRY_AFTER_MAX = 5
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.RETRY_AFTER_MAX)
+
+
+class _TTLCache:
+    """
+    Thread-safe dict cache with per-entry expiry and a size cap
+
+    Entries expire ttl seconds after they are set, or never when ttl is
+    None. Expired entries are swept on write. When the cache is full the
+    oldest entry is dropped: dict order is insertion order, and setting a
+    key again moves it to the end.
+    """
+
+    def __init__(self, maxsize, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expiry timestamp or None, value)
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the unexpired value for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and (entry[0] is None or time.monotonic() < entry[0]):
+            return entry[1]
+        return None
+
+    def set(self, key, value, ttl=None):
+        """Store value for ttl seconds (the cache's default when None)"""
+        if ttl is None:
+            ttl = self.ttl
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, (expires_at, _) in self._entries.items()
+                       if expires_at is not None and expires_at <= now]
+            for k in expired:
+                del self._entries[k]
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (None if ttl is None else now + ttl, value)
+
+    def get_or_load(self, key, loader, ttl=None):
+        """Return the cached value for key, calling loader() and storing its result on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if value is not None:
+                self.set(key, value, ttl)
+        return value
+
+    def discard(self, predicate=None):
+        """Drop the entries whose key matches predicate, or all of them"""
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+
+# name -> _TTLCache for caches every client in the process should share
+_shared_caches = {}
+_shared_caches_lock = threading.Lock()
+
+
+def _get_shared_cache(name, maxsize, ttl=None):
+    """Return the process-wide cache for name, creating it on first use"""
+    with _shared_caches_lock:
+        cache = _shared_caches.get(name)
+        if cache is None:
+            cache = _shared_caches[name] = _TTLCache(maxsize, ttl)
+        return cache
+
+
+class _CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one upstream
+
+    After `failures` consecutive failures check() raises immediately for
+    `reset` seconds. The first call after that is let through as a probe
+    (half-open) while the others keep failing fast; a success closes the
+    circuit and another failure reopens it.
+    """
+
+    def __init__(self, name, failures, reset):
+        self.name = name
+        self.failures = failures
+        self.reset = reset
+        self._failures = 0
+        # 0.0 while closed, otherwise when the next probe may go through
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if not self._open_until:
+            return 'closed'
+        return 'open' if time.monotonic() < self._open_until else 'half-open'
+
+    def check(self):
+        """Raise requests.ConnectionError unless a call may go through"""
+        if not self._open_until:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if self._open_until and now < self._open_until:
+                raise requests.ConnectionError(f'{self.name} unavailable, skipping request')
+            if self._open_until:
+                # Half-open: this call probes, the rest wait out another period
+                self._open_until = now + self.reset
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failures:
+                if not self._open_until:
+                    logger.warning("Circuit opened for %s after %d consecutive failures",
+                                   self.name, self._failures)
+                self._open_until = time.monotonic() + self.reset
+
+    def record_success(self):
+        if not self._failures:
+            return
+        with self._lock:
+            if self._open_until:
+                logger.warning("Circuit closed for %s", self.name)
+            self._failures = 0
+            self._open_until = 0.0
+
+
+# name -> _CircuitBreaker; shared so every client in the process (routes and
+# services each create their own) sees the same upstream health
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def _get_breaker(name, failures, reset):
+    """Return the process-wide breaker for name, creating it on first use"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = _CircuitBreaker(name, failures, reset)
+        return breaker
+
+
+# Path segments that are IDs (UUIDs, numeric IDs, team abbreviations) rather
+# than route names; API version segments like "v2" are route names
+_ID_SEGMENT_RE = re.compile(r'^(?!v\d+$)(?=.*[0-9A-Z]).+$')
+
+
+class _RequestMetrics:
+    """
+    Per-endpoint request counts, latency and response sizes
+
+    Endpoints are keyed by method and path template (IDs replaced with
+    ":id"), so /players/42/history and /players/7/history aggregate
+    together. Each latency is counted in the first bucket whose upper
+    bound it falls under. Status codes are string keys, and transport
+    errors are counted by exception name in a separate dict, so the
+    snapshot serializes as JSON with sorted keys.
+    """
+
+    # Upper bounds (seconds) of the latency histogram buckets
+    LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float('inf'))
+
+    def __init__(self):
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint(request):
+        segments = urlsplit(request.url).path.split('/')
+        path = '/'.join(':id' if _ID_SEGMENT_RE.match(segment) else segment
+                        for segment in segments)
+        return f'{request.method} {path}'
+
+    def record(self, request, seconds, status=None, nbytes=0, error=None):
+        key = self.endpoint(request)
+        with self._lock:
+            entry = self._endpoints.get(key)
+            if entry is None:
+                entry = self._endpoints[key] = {
+                    'count': 0,
+                    'total_seconds': 0.0,
+                    'max_seconds': 0.0,
+                    'bytes': 0,
+                    'statuses': {},
+                    'errors': {},
+                    'buckets': [0] * len(self.LATENCY_BUCKETS)
+                }
+            entry['count'] += 1
+            entry['total_seconds'] += seconds
+            entry['max_seconds'] = max(entry['max_seconds'], seconds)
+            entry['bytes'] += nbytes
+            if error is not None:
+                entry['errors'][error] = entry['errors'].get(error, 0) + 1
+            else:
+                status = str(status)
+                entry['statuses'][status] = entry['statuses'].get(status, 0) + 1
+            for i, bound in enumerate(self.LATENCY_BUCKETS):
+                if seconds <= bound:
+                    entry['buckets'][i] += 1
+                    break
+
+    def snapshot(self):
+        """Copy of the stats, with average latency and labelled buckets"""
+        with self._lock:
+            endpoints = {key: dict(entry, statuses=dict(entry['statuses']),
+                                   errors=dict(entry['errors']),
+                                   buckets=list(entry['buckets']))
+                         for key, entry in self._endpoints.items()}
+        for entry in endpoints.values():
+            entry['avg_seconds'] = entry['total_seconds'] / entry['count']
+            entry['buckets'] = {
+                ('+Inf' if bound == float('inf') else str(bound)): count
+                for bound, count in zip(self.LATENCY_BUCKETS, entry['buckets'])
+            }
+        return endpoints
+
+
+# Shared by every client in the process, like the circuit breakers
+_metrics = _RequestMetrics()
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pooled sockets send TCP keepalive probes
+
+    With a breaker, requests fail fast while it is open; connection
+    errors, timeouts and 5xx responses (after retries) count as failures.
+    Every request that goes out is recorded in _metrics.
+    """
+
+    def __init__(self, *args, breaker=None, **kwargs):
+        self._breaker = breaker
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if self._breaker is not None:
+            self._breaker.check()
+        start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+            # Session.send reads the body right after this anyway; reading it
+            # here puts the download in the timing
+            nbytes = 0 if kwargs.get('stream') else len(response.content)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            _metrics.record(request, time.perf_counter() - start, error=type(e).__name__)
+            if self._breaker is not None:
+                self._breaker.record_failure()
+            raise
+        _metrics.record(request, time.perf_counter() - start, status=response.status_code, nbytes=nbytes)
+        if self._breaker is not None:
+            if response.status_code >= 500:
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+        return response
+
+
+def _is_valid_id(value):
+    """Whether value can be an ID path segment: set, not blank, no slashes"""
+    if value is None:
+        return False
+    value = str(value).strip()
+    return bool(value) and '/' not in value
+
+
+_client = None
+
+
+def get_client():
+    """Return the process-wide FantasyAPIClient, creating it on first use"""
+    global _client
+    if _client is None:
+        _client = FantasyAPIClient()
+    return _client
+
+
 class FantasyAPIClient:
     # API request timeout in seconds
     REQUEST_TIMEOUT = 10
+    # (connect, read) timeouts for the v2 detail endpoints: an unreachable
+    # host fails after a few seconds, and the small per-player and per-game
+    # payloads don't wait as long as full-season schedules
+    CONNECT_TIMEOUT = 3.05
+    SCHEDULE_TIMEOUT = (CONNECT_TIMEOUT, 10)
+    HISTORY_TIMEOUT = (CONNECT_TIMEOUT, 5)
+    VS_DEFENSE_TIMEOUT = (CONNECT_TIMEOUT, 5)
+    GAME_STATS_TIMEOUT = (CONNECT_TIMEOUT, 5)
+    # Retries for connection errors and RETRY_STATUSES responses; POSTs are
+    # only retried on connection errors (urllib3's default allowed methods)
+    MAX_RETRIES = 2
+    AI_MAX_RETRIES = 1
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    # Random seconds added to each backoff so clients that failed together
+    # don't retry in lockstep (urllib3 2.x); sleeps are capped by _BoundedRetry
+    RETRY_BACKOFF_JITTER = 0.1
+    # Consecutive upstream failures that open the circuit, and seconds calls
+    # then fail fast before a probe is let through; the AI/garden endpoints
+    # have their own circuit so a slow model doesn't take down plain lookups
+    BREAKER_FAILURES = 5
+    BREAKER_RESET = 30
+    AI_BREAKER_FAILURES = 5
+    AI_BREAKER_RESET = 60
+    # Max concurrent page requests when paginating /players
+    PAGE_FETCH_WORKERS = 8
+    # Max page requests in flight across all concurrent searches on a client;
+    # kept under the adapter's pool_maxsize so other calls still get a connection
+    MAX_CONCURRENT_PAGE_FETCHES = 16
+    # Seconds a search_players result is reused for the same query/position
+    SEARCH_CACHE_TTL = 60
+    # Max cached search results; the oldest entry is dropped beyond this
+    SEARCH_CACHE_SIZE = 512
+    # Seconds a player's game log is reused, and how many players' logs are kept
+    GAMES_CACHE_TTL = 300
+    GAMES_CACHE_SIZE = 256
+    # Games requested per player game log (the API's page size)
+    GAME_LOG_LIMIT = 100
+    # Max distinct player names kept in the normalized-name memo
+    NAME_CACHE_SIZE = 5000
+    # Seconds slow-changing league data is reused: team details, team
+    # schedules, and rankings/standings/stat leaders
+    TEAM_INFO_CACHE_TTL = 86400
+    TEAM_SCHEDULE_CACHE_TTL = 3600
+    RANKINGS_CACHE_TTL = 300
+    # Seconds player and team injury reports are reused
+    INJURY_CACHE_TTL = 300
+    # Seconds player team histories, player-vs-defense splits and per-game
+    # team stats are reused (game stats stay short: games can be in progress)
+    PLAYER_HISTORY_CACHE_TTL = 86400
+    VS_DEFENSE_CACHE_TTL = 900
+    GAME_STATS_CACHE_TTL = 60
+    # Max cached responses across those endpoints
+    RESPONSE_CACHE_SIZE = 512
+    # Seconds a 404 is remembered, so repeated lookups of a missing ID fail
+    # without a round trip, and how many are kept
+    NOT_FOUND_CACHE_TTL = 60
+    NOT_FOUND_CACHE_SIZE = 256
+    # Max rarely-changing responses (rosters, coaching staffs, schedules,
+    # player histories) kept for conditional GETs
+    STATIC_CACHE_SIZE = 1024
+    # Longest token the fallback edit distance handles bit-parallel
+    BIT_PARALLEL_MAX_LEN = 64
+    # Redis expiry (seconds) for API data shared across worker processes
+    TEAMS_CACHE_EXPIRY = 86400
+    SCHEDULE_CACHE_EXPIRY = 3600
+    PLAYERS_CACHE_EXPIRY = 600
 
     def __init__(self):
-        # Use API v2 by default, fallback to v1 if specified
-        api_version = os.getenv('API_VERSION', 'v2')
-        self.base_url = os.getenv('API_BASE_URL', f'https://nfl.wearemachina.com/api/{api_version}')
-        self.api_key = os.getenv('API_KEY')
-        self.api_version = api_version
+        self.base_url = API_BASE_URL
+        self.api_key = API_KEY
+        self.api_version = API_VERSION
         self._teams_cache = None
+        # Full /teams records behind _teams_cache; only set once a fetch succeeds
+        self._team_records = None
+        # (defense entry, lowercased name, lowercased abbreviation) per team
+        self._defenses_cache = None
+        # abbreviation -> team_id, built together with _teams_cache
+        self._abbr_to_id_cache = None
         self._schedule_cache = {}
-        
-        logger.info(f"FantasyAPIClient initialized with API {api_version}: {self.base_url}")
+        # "{season}_{week}" -> {team_id: opponent team_id}
+        self._opponents_cache = {}
+        # (normalized query, position) -> results
+        self._search_cache = _TTLCache(self.SEARCH_CACHE_SIZE, self.SEARCH_CACHE_TTL)
+        # str(player_id) -> last GAME_LOG_LIMIT games
+        self._games_cache = _TTLCache(self.GAMES_CACHE_SIZE, self.GAMES_CACHE_TTL)
+        # (endpoint, args) -> parsed data, with a TTL per endpoint
+        self._response_cache = _TTLCache(self.RESPONSE_CACHE_SIZE)
+        # (url, params) -> 404 response for GETs; shared by every client in
+        # the process so invalidate_missing() reaches all of them
+        self._not_found = _get_shared_cache(
+            'not_found', self.NOT_FOUND_CACHE_SIZE, self.NOT_FOUND_CACHE_TTL
+        )
+        # (url, params) -> (validator headers, parsed body) for _get_static_json;
+        # no expiry, the server decides freshness on each revalidation
+        self._static_cache = _TTLCache(self.STATIC_CACHE_SIZE)
+        # player name -> (lowercased name, name parts)
+        self._name_cache = {}
+        # request key -> Future shared by concurrent callers of the same lookup
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._page_fetch_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_PAGE_FETCHES)
+        # Circuit breakers for the API host (every session request) and
+        # for _ai_request
+        self._breaker = _get_breaker(self.base_url, self.BREAKER_FAILURES, self.BREAKER_RESET)
+        self._ai_breaker = _get_breaker(
+            f'{self.base_url} AI', self.AI_BREAKER_FAILURES, self.AI_BREAKER_RESET
+        )
+
+        # Reuse TCP/TLS connections across calls (search pagination, teams +
+        # schedule + stats chains) instead of a fresh handshake per request
+        self._session = requests.Session()
+        adapter = _KeepAliveAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=self._build_retry(self.MAX_RETRIES),
+            breaker=self._breaker
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        # AI endpoints already wait up to 30s per attempt, so they get fewer
+        # retries; the session picks the adapter with the longest prefix
+        self._session.mount(
+            f'{self.base_url}/ai/',
+            _KeepAliveAdapter(max_retries=self._build_retry(self.AI_MAX_RETRIES))
+        )
+        # Neither AI adapter carries the host breaker: AI and garden calls
+        # are guarded by _ai_request's circuit instead, so a failing model
+        # doesn't make plain lookups fail fast
+        self._session.mount(
+            f'{self.base_url}/garden/',
+            _KeepAliveAdapter(max_retries=self._build_retry(self.MAX_RETRIES))
+        )
+        # Every call sends the same headers, so set them once on the session
+        self._session.headers.update(self._get_headers())
+        
+        logger.info("FantasyAPIClient initialized with API %s: %s", API_VERSION, self.base_url)
+
+    def _build_retry(self, total):
+        """
+        Retry policy for the session's adapters
+
+        Connection errors and transient upstream statuses (rate limiting,
+        5xx) are retried with jittered exponential backoff, honoring
+        Retry-After up to _BoundedRetry.RETRY_AFTER_MAX seconds. Once
+        retries run out the last response is returned as-is, so
+        raise_for_status() still raises the usual HTTPError.
+        """
+        backoff = {}
+        if _RETRY_HAS_JITTER:
+            # 2.x binds the backoff_max default at definition time, so the
+            # subclass's cap has to be passed explicitly
+            backoff = {
+                'backoff_jitter': self.RETRY_BACKOFF_JITTER,
+                'backoff_max': _BoundedRetry.DEFAULT_BACKOFF_MAX
+            }
+        return _BoundedRetry(
+            total=total,
+            backoff_factor=0.2,
+            status_forcelist=self.RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            **backoff
+        )
+
+    def close(self):
+        """Close the pooled connections held by the client's session"""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _get_headers(self, include_api_key=True):
         """Get request headers, including API key by default for unlimited access"""
-        headers = {'Content-Type': 'application/json'}
+        # requests already negotiates gzip/deflate; ask for JSON explicitly so
+        # error paths don't come back as HTML pages
+        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
         # Always include API key if available (provides unlimited rate limit)
         if include_api_key and self.api_key:
             headers['X-API-Key'] = self.api_key
         return headers
 
+    def _get_team_records(self):
+        """
+        Get the full /teams records, fetching them on first use
+
+        Raises on request failure; a failed or empty fetch is not kept, so
+        the next call tries again.
+        """
+        if self._team_records is None:
+            # Other workers may already have fetched the teams
+            teams = cache_get_json('nflapi:teams:v1')
+            if teams is None:
+                teams = self._request('GET', '/teams', params={'limit': 100}, default=[])
+                if teams:
+                    cache_set_json('nflapi:teams:v1', teams, self.TEAMS_CACHE_EXPIRY)
+            if not teams:
+                return teams
+            self._team_records = teams
+        return self._team_records
+
     def _get_teams(self):
         """Get and cache all teams"""
         if self._teams_cache is None:
             try:
-                response = requests.get(
-                    f'{self.base_url}/teams',
-                    params={'limit': 100},
-                    headers=self._get_headers(),
-                    timeout=self.REQUEST_TIMEOUT
-                )
-                response.raise_for_status()
-                teams = response.json().get('data', [])
+                teams = self._get_team_records()
                 # Create map of team_id -> abbreviation
-                self._teams_cache = {team['id']: team['abbreviation'] for team in teams}
+                teams_map = {team['id']: team['abbreviation'] for team in teams}
             except requests.Timeout:
                 logger.error("Timeout loading teams cache")
-                self._teams_cache = {}
+                teams_map = {}
             except Exception as e:
-                logger.error(f"Failed to load teams cache: {e}")
-                self._teams_cache = {}
+                logger.error("Failed to load teams cache: %s", e)
+                teams_map = {}
+            # Reverse map is set first: other threads treat _teams_cache
+            # being set as both maps being ready
+            self._abbr_to_id_cache = {abbr: tid for tid, abbr in teams_map.items()}
+            self._teams_cache = teams_map
         return self._teams_cache
 
+    def _get_team_id(self, team_abbr):
+        """Look up a team_id by abbreviation, or None if unknown"""
+        self._get_teams()
+        return self._abbr_to_id_cache.get(team_abbr)
+
+    def _with_teams(self, fetch, *args):
+        """
+        Return (fetch(*args), teams map)
+
+        When the teams cache is cold it is loaded on a worker thread while
+        fetch runs, so the two round trips overlap instead of queueing.
+        """
+        if self._teams_cache is not None:
+            return fetch(*args), self._teams_cache
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            teams_future = executor.submit(self._get_teams)
+            result = fetch(*args)
+        return result, teams_future.result()
+
+    def _request(self, method, path, params=None, json=None, default=None, timeout=None):
+        """
+        Send a request to the API and return the response's 'data' field
+
+        default is returned when the body has no 'data' key. Raises on
+        request failure; callers catch and log it with their own context.
+        Concurrent identical GETs share one request, and a GET that 404'd
+        raises again without a request for NOT_FOUND_CACHE_TTL seconds.
+        """
+        url = f'{self.base_url}{path}'
+        params_key = tuple(sorted(params.items())) if params else ()
+
+        def send():
+            response = self._session.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                timeout=timeout or self.REQUEST_TIMEOUT
+            )
+            if method == 'GET' and response.status_code == 404:
+                self._remember_not_found((url, params_key), response)
+            response.raise_for_status()
+            return _json_loads(response.content).get('data', default)
+
+        # POSTs are not coalesced: two identical bodies may still be two actions
+        if method != 'GET':
+            return send()
+        self._raise_if_not_found((url, params_key))
+        return self._coalesce(('GET', path, params_key), send)
+
+    def _raise_if_not_found(self, cache_key):
+        """Raise the remembered 404 for cache_key, if it hasn't expired"""
+        response = self._not_found.get(cache_key)
+        if response is not None:
+            raise requests.HTTPError(
+                f'404 Client Error: Not Found (cached) for url: {response.url}',
+                response=response
+            )
+
+    def _remember_not_found(self, cache_key, response):
+        """Remember a 404 response for NOT_FOUND_CACHE_TTL seconds"""
+        self._not_found.set(cache_key, response)
+
+    def invalidate_missing(self, identifier=None):
+        """
+        Forget remembered 404s, e.g. once a missing player has been added
+
+        The 404 cache is shared, so this applies to every client in the
+        process.
+
+        Args:
+            identifier: Only forget 404s for URLs with this ID as a path
+                segment; None forgets them all
+        """
+        if identifier is None:
+            self._not_found.discard()
+            return
+        identifier = str(identifier)
+        self._not_found.discard(lambda key: identifier in key[0].split('/'))
+
+    def _ai_request(self, method, path, **kwargs):
+        """
+        _request for the AI and garden endpoints, behind a circuit breaker
+
+        After AI_BREAKER_FAILURES consecutive upstream failures (timeouts,
+        connection errors, 5xx) calls fail immediately for AI_BREAKER_RESET
+        seconds instead of each waiting out a 30s timeout. The next call
+        after that goes through, and another failure reopens the circuit.
+        """
+        self._ai_breaker.check()
+        try:
+            result = self._request(method, path, **kwargs)
+        except requests.RequestException as e:
+            # 4xx (unknown player, bad query) says nothing about upstream health
+            if e.response is None or e.response.status_code >= 500:
+                self._ai_breaker.record_failure()
+            raise
+        self._ai_breaker.record_success()
+        return result
+
+    def health(self):
+        """Circuit state ('closed', 'open' or 'half-open') per upstream"""
+        return {
+            'api': self._breaker.state,
+            'ai': self._ai_breaker.state
+        }
+
+    def request_metrics(self):
+        """
+        Per-endpoint request stats for every client in the process
+
+        Returns:
+            Dictionary keyed by "METHOD /path/:id/template" with count,
+            total/avg/max latency in seconds, response bytes, counts per
+            status code and per transport error (exception name) and
+            latency histogram buckets
+        """
+        return _metrics.snapshot()
+
+    def _get_cached_response(self, cache_key):
+        """Return unexpired cached endpoint data, or None"""
+        return self._response_cache.get(cache_key)
+
+    def _cache_response(self, cache_key, data, ttl):
+        """
+        Store endpoint data for ttl seconds, keeping the cache bounded
+
+        Empty results are not stored: the methods return them on failure,
+        and caching one would hide the data until it expired.
+        """
+        if data:
+            self._response_cache.set(cache_key, data, ttl)
+
+    def _get_static_json(self, url, params=None, timeout=None):
+        """
+        GET a rarely-changing endpoint, revalidating the last response
+
+        The ETag / Last-Modified of the previous response are sent back, so
+        when the server answers 304 the stored body is reused instead of
+        downloading it again. Raises on request failure like a plain GET;
+        404s are remembered and concurrent identical calls share one
+        request, like in _request.
+        The returned object is shared between calls and must not be modified.
+        """
+        cache_key = (url, tuple(sorted(params.items())) if params else ())
+        self._raise_if_not_found(cache_key)
+        return self._coalesce(
+            ('static',) + cache_key,
+            lambda: self._fetch_static_json(cache_key, params, timeout)
+        )
+
+    def _fetch_static_json(self, cache_key, params, timeout):
+        """Do the conditional GET for _get_static_json"""
+        url = cache_key[0]
+        entry = self._static_cache.get(cache_key)
+        response = self._session.get(
+            url,
+            params=params,
+            headers=entry[0] if entry else None,
+            timeout=timeout or self.REQUEST_TIMEOUT
+        )
+        if entry and response.status_code == 304:
+            return entry[1]
+        if response.status_code == 404:
+            self._remember_not_found(cache_key, response)
+        response.raise_for_status()
+        data = _json_loads(response.content)
+
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        if validators:
+            self._static_cache.set(cache_key, (validators, data))
+        return data
+
     def _enrich_player_with_team(self, player):
         """Add team abbreviation to player data"""
         teams = self._get_teams()
@@ -60,16 +824,84 @@ class FantasyAPIClient:
             player['team'] = 'FA'  # Free Agent
         return player
 
+    def _coalesce(self, key, fetch):
+        """
+        Run fetch() once for concurrent callers asking for the same key
+
+        The first caller does the request; callers arriving while it is in
+        flight wait for and share its result instead of repeating it.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        if not owner:
+            return future.result()
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def bulk_get_players(self, player_ids):
+        """
+        Get player details for several IDs at once
+
+        Returns a list aligned with player_ids (None for failed lookups).
+        The lookups run concurrently over the pooled session.
+        """
+        player_ids = list(player_ids)
+        if not player_ids:
+            return []
+        workers = min(self.PAGE_FETCH_WORKERS, len(player_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_player_data, player_ids))
+
+    def fetch_many(self, calls):
+        """
+        Run several independent client calls concurrently
+
+        Args:
+            calls: List of (method, args, kwargs) tuples, e.g.
+                [(client.get_team_injuries_v2, (team_id,), {}),
+                 (client.get_team_schedule_v2, (team_id,), {'season': 2024})]
+
+        Returns:
+            List of results in the same order as calls. The client methods
+            handle their own errors, so a failed lookup shows up as its
+            usual None / [] rather than an exception.
+        """
+        calls = list(calls)
+        if not calls:
+            return []
+        workers = min(self.PAGE_FETCH_WORKERS, len(calls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(method, *args, **kwargs) for method, args, kwargs in calls]
+            return [future.result() for future in futures]
+
     def get_player_data(self, player_id):
         """Get player details by ID"""
+        # Keyed like the URL, so 42 and '42' share one request
+        return self._coalesce(('player', str(player_id)), lambda: self._fetch_player_data(player_id))
+
+    def _fetch_player_data(self, player_id):
+        """Fetch one player and enrich it with the team abbreviation"""
+        url = f'{self.base_url}/players/{player_id}'
         try:
-            response = requests.get(
-                f'{self.base_url}/players/{player_id}',
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
+            # Unknown IDs are the usual 404s here, so they are remembered too
+            self._raise_if_not_found((url, ()))
+            response = self._session.get(url, timeout=self.REQUEST_TIMEOUT)
+            if response.status_code == 404:
+                self._remember_not_found((url, ()), response)
             response.raise_for_status()
-            player = response.json()
+            player = _json_loads(response.content)
             # Enrich with team abbreviation if it's in the data wrapper
             if 'data' in player:
                 player['data'] = self._enrich_player_with_team(player['data'])
@@ -77,127 +909,203 @@ class FantasyAPIClient:
                 player = self._enrich_player_with_team(player)
             return player
         except requests.Timeout:
-            logger.error(f"Timeout getting player data for {player_id}")
+            logger.error("Timeout getting player data for %s", player_id)
             return None
         except Exception as e:
-            logger.error(f"Failed to get player data for {player_id}: {e}")
+            logger.error("Failed to get player data for %s: %s", player_id, e)
             return None
 
-    def search_players(self, query, position=None):
-        """Search for players by name and optionally filter by position"""
+    def search_players(self, query, position=None, use_cache=True):
+        """
+        Search for players by name and optionally filter by position
+
+        use_cache=False skips the recent-search and shared position listing
+        caches and fetches from the API (e.g. for a forced player cache
+        refresh); the fresh results are still cached for later calls.
+        """
         # Special case: DEF means team defenses, not individual players
         if position == 'DEF':
             return self._search_team_defenses(query)
 
-        # The API limits responses to 100 per request, so we need to paginate
-        # Fetch ALL players for the position to ensure we don't miss anyone
-
-        all_players = []
-        limit = 100
-        offset = 0
+        # Repeated searches (e.g. as the user types) reuse recent results
+        cache_key = ((query or '').lower().strip(), position)
+        cached = self._get_cached_search(cache_key) if use_cache else None
+        if cached is not None:
+            return cached
 
         try:
-            # First request to get total count
-            # Use API's 'search' param to get candidates (even though it's fuzzy/broken)
-            # Then use our scoring algorithm to properly rank and filter results
-            params = {'limit': limit, 'offset': offset, 'status': 'active'}
-            if query:
-                params['search'] = query  # Get candidates from API
-            if position:
-                params['position'] = position
-
-            response = requests.get(
-                f'{self.base_url}/players',
-                params=params,
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            data = response.json()
-            all_players.extend(data.get('data', []))
-            total = data.get('meta', {}).get('total', 0)
-
-            # Fetch remaining pages
-            # When using search, API returns many fuzzy matches - limit to 200 to avoid timeout
-            # Our scoring will filter these down to the best matches
-            # With position filter, can fetch more (usually <100 per position)
-            if query and not position:
-                max_fetch = min(total, 200)  # Limit fuzzy search results
-            elif position:
-                max_fetch = min(total, 500)  # Position-filtered is more targeted
-            else:
-                max_fetch = min(total, 100)  # No query or position = just first 100
-            while offset + limit < max_fetch:
-                offset += limit
-                params['offset'] = offset
-                response = requests.get(
-                    f'{self.base_url}/players',
-                    params=params,
-                    headers=self._get_headers(),
-                    timeout=self.REQUEST_TIMEOUT
-                )
-                response.raise_for_status()
-                all_players.extend(response.json().get('data', []))
-
-            # Enrich all players with team abbreviation
-            all_players = [self._enrich_player_with_team(player) for player in all_players]
+            # Position-only listings (e.g. the player cache refresh) don't
+            # depend on the query, so they are shared across workers
+            players_cache_key = f'nflapi:players:{position}' if position and not query else None
+            all_players = cache_get_json(players_cache_key) if players_cache_key and use_cache else None
+            if all_players is None:
+                all_players = self._fetch_players(query, position)
+                if players_cache_key and all_players:
+                    cache_set_json(players_cache_key, all_players, self.PLAYERS_CACHE_EXPIRY)
 
             # Advanced search with relevance scoring
             # ALWAYS score and filter when there's a query (API search is broken)
             if query and all_players:
                 scored_players = self._score_and_filter_players(all_players, query)
                 # Return top 20 most relevant, or all if fewer results
-                return scored_players[:20] if scored_players else []
+                results = scored_players[:20] if scored_players else []
+            else:
+                results = all_players[:20]
+
+            # Enrich with team abbreviation; scoring only reads names and
+            # status, so only the players actually returned need it
+            results = [self._enrich_player_with_team(player) for player in results]
 
-            return all_players[:20]
+            self._cache_search(cache_key, results)
+            return list(results)
         except requests.Timeout:
-            logger.error(f"Timeout searching for players: query={query}, position={position}")
+            logger.error("Timeout searching for players: query=%s, position=%s", query, position)
             return []
         except Exception as e:
-            logger.error(f"Failed to search players: {e}")
+            logger.error("Failed to search players: %s", e)
             return []
 
+    def _get_cached_search(self, cache_key):
+        """Return a copy of a fresh cached search result, or None"""
+        results = self._search_cache.get(cache_key)
+        return list(results) if results is not None else None
+
+    def _cache_search(self, cache_key, results):
+        """Store a search result for SEARCH_CACHE_TTL seconds"""
+        self._search_cache.set(cache_key, results)
+
+    def _fetch_players(self, query, position):
+        """Fetch the /players candidates for a search, paginating as needed"""
+        # The API limits responses to 100 per request, so we need to paginate
+        # Fetch ALL players for the position to ensure we don't miss anyone
+
+        all_players = []
+        limit = 100
+        offset = 0
+
+        # First request to get total count
+        # Use API's 'search' param to get candidates (even though it's fuzzy/broken)
+        # Then use our scoring algorithm to properly rank and filter results
+        params = {'limit': limit, 'offset': offset, 'status': 'active'}
+        if query:
+            params['search'] = query  # Get candidates from API
+        if position:
+            params['position'] = position
+
+        response = self._session.get(
+            f'{self.base_url}/players',
+            params=params,
+            timeout=self.REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        all_players.extend(data.get('data', []))
+        total = data.get('meta', {}).get('total', 0)
+
+        # Fetch remaining pages
+        # When using search, API returns many fuzzy matches - limit to 200 to avoid timeout
+        # Our scoring will filter these down to the best matches
+        # With position filter, can fetch more (usually <100 per position)
+        if query and not position:
+            max_fetch = min(total, 200)  # Limit fuzzy search results
+        elif position:
+            max_fetch = min(total, 500)  # Position-filtered is more targeted
+        else:
+            max_fetch = min(total, 100)  # No query or position = just first 100
+        # Offsets are known once we have the total, so fetch the pages
+        # concurrently; map() keeps them in offset order
+        offsets = list(range(offset + limit, max_fetch, limit))
+        if offsets:
+            with ThreadPoolExecutor(max_workers=min(self.PAGE_FETCH_WORKERS, len(offsets))) as executor:
+                pages = executor.map(lambda page_offset: self._fetch_players_page(params, page_offset), offsets)
+                for page in pages:
+                    all_players.extend(page)
+        return all_players
+
+    def _fetch_players_page(self, params, offset):
+        """Fetch one page of /players for the given search params"""
+        with self._page_fetch_slots:
+            response = self._session.get(
+                f'{self.base_url}/players',
+                params={**params, 'offset': offset},
+                timeout=self.REQUEST_TIMEOUT
+            )
+        response.raise_for_status()
+        return _json_loads(response.content).get('data', [])
+
     def _search_team_defenses(self, query):
         """Search for team defenses"""
         try:
-            response = requests.get(
-                f'{self.base_url}/teams',
-                params={'limit': 100},
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            teams = response.json().get('data', [])
-
-            # Convert teams to player-like format for consistency
-            defenses = []
-            for team in teams:
-                defense = {
-                    'id': team['id'],
-                    'player_id': team['id'],
-                    'name': f"{team['city']} {team['name']}",
-                    'position': 'DEF',
-                    'team': team['abbreviation'],
-                    'status': 'active'
-                }
-                defenses.append(defense)
+            defenses = self._defenses_cache
+            if defenses is None:
+                # Teams barely change, so reuse the cached /teams records and
+                # build the defense entries once per client
+                defenses = []
+                for team in self._get_team_records():
+                    # Convert teams to player-like format for consistency
+                    defense = {
+                        'id': team['id'],
+                        'player_id': team['id'],
+                        'name': f"{team['city']} {team['name']}",
+                        'position': 'DEF',
+                        'team': team['abbreviation'],
+                        'status': 'active'
+                    }
+                    defenses.append((defense, defense['name'].lower(), defense['team'].lower()))
+                if defenses:
+                    self._defenses_cache = defenses
 
             # Filter by query if provided
             if query:
                 query_lower = query.lower()
-                defenses = [d for d in defenses if
-                           query_lower in d['name'].lower() or
-                           query_lower in d['team'].lower()]
+                defenses = [entry for entry in defenses if
+                            query_lower in entry[1] or
+                            query_lower in entry[2]]
 
-            return defenses[:20]
+            # Callers get their own copies of the cached entries
+            return [dict(defense) for defense, _, _ in defenses[:20]]
         except requests.Timeout:
-            logger.error(f"Timeout searching for team defenses: query={query}")
+            logger.error("Timeout searching for team defenses: query=%s", query)
             return []
         except Exception as e:
-            logger.error(f"Failed to search team defenses: {e}")
+            logger.error("Failed to search team defenses: %s", e)
             return []
 
-    def _score_and_filter_players(self, players, query):
+    def _build_search_index(self, players):
+        """
+        Normalize player names once into parallel lists for scoring
+
+        The index can be reused for any number of queries against the same
+        player list, so repeated searches skip the per-player dict lookups
+        and lower()/split() calls.
+        """
+        names = [player.get('name', '') for player in players]
+        normalized = [self._normalize_name(name) for name in names]
+        return {
+            'players': players,
+            'names': names,
+            'names_lower': [name_lower for name_lower, _ in normalized],
+            'name_parts': [name_parts for _, name_parts in normalized],
+            'active': [player.get('status', '').upper() == 'ACTIVE' for player in players],
+        }
+
+    def _normalize_name(self, name):
+        """
+        Return (lowercased name, name parts), memoized per name
+
+        Successive searches mostly see the same players, so most names are
+        normalized once per client rather than once per search.
+        """
+        normalized = self._name_cache.get(name)
+        if normalized is None:
+            if len(self._name_cache) >= self.NAME_CACHE_SIZE:
+                self._name_cache.clear()
+            name_lower = name.lower()
+            normalized = (name_lower, tuple(name_lower.split()))
+            self._name_cache[name] = normalized
+        return normalized
+
+    def _score_and_filter_players(self, players, query, limit=20, index=None):
         """
         Advanced search algorithm with fuzzy matching and relevance scoring
 
@@ -208,32 +1116,76 @@ class FantasyAPIClient:
         - Fuzzy match (edit distance): 30-60 points
         - Word boundary match: +20 points
         - Recent/active players: +10 points
+
+        Only the top `limit` results are returned. Scored candidates are
+        streamed straight into a bounded heap, so memory stays O(limit) no
+        matter how many players the API returned.
+
+        Pass an index from _build_search_index to reuse it across queries.
         """
         query_lower = query.lower().strip()
         query_parts = query_lower.split()
 
-        scored_results = []
+        if index is None:
+            index = self._build_search_index(players)
+        scored_results = self._iter_scored_players(index, query_lower, query_parts)
 
-        for player in players:
-            name = player.get('name', '')
-            name_lower = name.lower()
+        # Keep the top results by score (descending) then by name (alphabetically).
+        # The yielded tuples already sort in that order, so no key function is needed
+        top_results = heapq.nsmallest(limit, scored_results)
+
+        return [player for _, _, _, player in top_results]
+
+    def _iter_scored_players(self, index, query_lower, query_parts):
+        """
+        Yield (-score, name, seq, player) for every player relevant to the query
+
+        seq is the player's position in the index; it breaks ties in list
+        order and keeps tuple comparison from ever reaching the player dicts.
+        """
+        # Everything that depends only on the query is worked out once here
+        # rather than once per player
+        query_len = len(query_lower)
+        # Misspellings only count for longer words: up to 2 edits
+        # (30 - 5 per edit) past 4 chars, 1 edit (25) at 4 chars
+        part_limits = []
+        for query_part in query_parts:
+            query_part_len = len(query_part)
+            if query_part_len > 4:
+                part_limits.append((query_part, query_part_len, 2, 30))
+            elif query_part_len > 3:
+                part_limits.append((query_part, query_part_len, 1, 25))
+            else:
+                part_limits.append((query_part, query_part_len, 0, 0))
+        use_fuzzy_score = query_len >= 3
+        # A single-word query can never match on word boundaries
+        check_word_boundaries = len(query_parts) > 1
+        # With rapidfuzz installed its C implementation is called directly
+        # below, skipping the _levenshtein_distance frame for every pair
+        rf_levenshtein = _rf_levenshtein
+        levenshtein_distance = self._levenshtein_distance
+        fuzzy_match_score = self._fuzzy_match_score
+
+        for seq, (player, name, name_lower, name_parts, is_active) in enumerate(zip(
+                index['players'], index['names'], index['names_lower'],
+                index['name_parts'], index['active'])):
             score = 0
+            # One scan answers exact, prefix and substring matches
+            match_pos = name_lower.find(query_lower)
 
             # Exact match
-            if name_lower == query_lower:
+            if match_pos == 0 and len(name_lower) == query_len:
                 score = 100
             # Name starts with query
-            elif name_lower.startswith(query_lower):
+            elif match_pos == 0:
                 score = 80
             # Name contains query as substring
-            elif query_lower in name_lower:
+            elif match_pos > 0:
                 score = 50
             else:
                 # Fuzzy matching with word boundaries
-                name_parts = name_lower.split()
-
                 # Check each query part against each name part
-                for query_part in query_parts:
+                for query_part, query_part_len, max_edits, max_edit_score in part_limits:
                     best_part_score = 0
                     for name_part in name_parts:
                         # Exact word match
@@ -245,153 +1197,330 @@ class FantasyAPIClient:
                         # Contains
                         elif query_part in name_part:
                             best_part_score = max(best_part_score, 25)
-                        # Edit distance check for misspellings
-                        else:
-                            edit_dist = self._levenshtein_distance(query_part, name_part)
+                        # Edit distance check for misspellings, skipped when it
+                        # can't beat the best score so far or the lengths alone
+                        # rule it out
+                        elif (best_part_score < max_edit_score
+                              and abs(len(name_part) - query_part_len) <= max_edits):
+                            if rf_levenshtein is not None:
+                                edit_dist = rf_levenshtein(query_part, name_part, score_cutoff=max_edits)
+                            else:
+                                edit_dist = levenshtein_distance(query_part, name_part, max_distance=max_edits)
                             # Allow up to 2 character differences for words > 4 chars
-                            if len(query_part) > 4 and edit_dist <= 2:
+                            if query_part_len > 4 and edit_dist <= 2:
                                 best_part_score = max(best_part_score, 30 - (edit_dist * 5))
-                            elif len(query_part) > 3 and edit_dist <= 1:
+                            elif query_part_len > 3 and edit_dist <= 1:
                                 best_part_score = max(best_part_score, 25)
 
                     score += best_part_score
 
                 # Calculate sequential fuzzy score for full name
-                if len(query_lower) >= 3:
-                    fuzzy_score = self._fuzzy_match_score(name_lower, query_lower)
+                if use_fuzzy_score:
+                    fuzzy_score = fuzzy_match_score(name_lower, query_lower)
                     score += fuzzy_score
 
             # Bonus for word boundary matches (e.g., "T Brady" matches "Tom Brady")
-            if self._matches_word_boundaries(name_lower, query_parts):
+            if check_word_boundaries and self._matches_word_boundaries(name_parts, query_parts):
                 score += 20
 
             # Bonus for active status
-            if player.get('status', '').upper() == 'ACTIVE':
+            if is_active:
                 score += 10
 
             # Only include results with some relevance
             if score > 15:
-                scored_results.append({
-                    'player': player,
-                    'score': score,
-                    'name': name
-                })
+                yield -score, name, seq, player
 
-        # Sort by score (descending) then by name (alphabetically)
-        scored_results.sort(key=lambda x: (-x['score'], x['name']))
+    def _levenshtein_distance(self, s1, s2, max_distance=None):
+        """
+        Calculate Levenshtein distance between two strings (edit distance)
 
-        return [item['player'] for item in scored_results]
+        When max_distance is given the caller only cares whether the distance
+        is within that bound, so any larger distance is reported as
+        max_distance + 1 and the computation stops as soon as that is certain.
+        """
+        if _rf_levenshtein is not None:
+            return _rf_levenshtein(s1, s2, score_cutoff=max_distance)
 
-    def _levenshtein_distance(self, s1, s2):
-        """Calculate Levenshtein distance between two strings (edit distance)"""
+        # s2 is the shorter string from here on
         if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
+            s1, s2 = s2, s1
+
+        # The length difference is a lower bound on the edit distance
+        if max_distance is not None and len(s1) - len(s2) > max_distance:
+            return max_distance + 1
+
+        # A shared prefix or suffix never adds to the distance, so trim it
+        # before the DP; near-miss names usually differ in only a few chars
+        start = 0
+        shorter = len(s2)
+        while start < shorter and s1[start] == s2[start]:
+            start += 1
+        end = 0
+        while end < shorter - start and s1[-1 - end] == s2[-1 - end]:
+            end += 1
+        if start or end:
+            s1 = s1[start:len(s1) - end]
+            s2 = s2[start:shorter - end]
 
         if len(s2) == 0:
             return len(s1)
 
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                # Cost of insertions, deletions, or substitutions
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
+        # Name tokens are short enough for the bit-parallel algorithm
+        if len(s2) <= self.BIT_PARALLEL_MAX_LEN:
+            return self._bit_parallel_distance(s1, s2, max_distance)
 
-        return previous_row[-1]
+        # Two preallocated rows, swapped after each pass
+        previous_row = list(range(len(s2) + 1))
+        current_row = [0] * (len(s2) + 1)
+        for i, c1 in enumerate(s1):
+            # The diagonal and left neighbours are carried in locals, so each
+            # cell reads the previous row once and compares without min()
+            diagonal = previous_row[0]
+            current_row[0] = left = row_min = i + 1
+            for j, c2 in enumerate(s2, 1):
+                above = previous_row[j]
+                # Cost of substitutions, insertions, or deletions
+                cell = diagonal + (c1 != c2)
+                if above + 1 < cell:
+                    cell = above + 1
+                if left + 1 < cell:
+                    cell = left + 1
+                current_row[j] = cell
+                if cell < row_min:
+                    row_min = cell
+                diagonal = above
+                left = cell
+            # Row minimums never decrease, so the bound can no longer be met
+            if max_distance is not None and row_min > max_distance:
+                return max_distance + 1
+            previous_row, current_row = current_row, previous_row
+
+        distance = previous_row[-1]
+        if max_distance is not None and distance > max_distance:
+            return max_distance + 1
+        return distance
+
+    def _bit_parallel_distance(self, text, pattern, max_distance=None):
+        """
+        Levenshtein distance via Myers/Hyyrö bit-parallel DP
+
+        Each DP column is held as bit-vectors of +1/-1 vertical deltas in
+        Python ints (one bit per pattern character), so a whole column is
+        updated with a handful of integer operations per text character.
+        Same contract as _levenshtein_distance; pattern must be non-empty.
+        """
+        pattern_len = len(pattern)
+        # Bit mask of the positions where each character occurs in the pattern
+        char_masks = {}
+        for i, char in enumerate(pattern):
+            char_masks[char] = char_masks.get(char, 0) | (1 << i)
+
+        full_mask = (1 << pattern_len) - 1
+        last_bit = 1 << (pattern_len - 1)
+        positive_v = full_mask
+        negative_v = 0
+        distance = pattern_len
+        remaining = len(text)
+
+        for char in text:
+            eq = char_masks.get(char, 0)
+            xv = eq | negative_v
+            xh = (((eq & positive_v) + positive_v) ^ positive_v) | eq
+            positive_h = negative_v | ~(xh | positive_v)
+            negative_h = positive_v & xh
+            if positive_h & last_bit:
+                distance += 1
+            elif negative_h & last_bit:
+                distance -= 1
+            remaining -= 1
+            # Each remaining column lowers the distance by at most one
+            if max_distance is not None and distance - remaining > max_distance:
+                return max_distance + 1
+            # Shifting in a 1 encodes the first row's D[0][j] = j
+            positive_h = (positive_h << 1) | 1
+            negative_h <<= 1
+            positive_v = (negative_h | ~(xv | positive_h)) & full_mask
+            negative_v = positive_h & xv
+
+        if max_distance is not None and distance > max_distance:
+            return max_distance + 1
+        return distance
 
     def _fuzzy_match_score(self, text, pattern):
         """Calculate fuzzy match score based on character proximity"""
         if not pattern:
             return 0
 
+        pattern_len = len(pattern)
         score = 0
         pattern_idx = 0
-
-        for i, char in enumerate(text):
-            if pattern_idx < len(pattern) and char == pattern[pattern_idx]:
-                # Characters match in sequence
-                score += max(30 - pattern_idx, 5)
-                pattern_idx += 1
+        position = -1
+
+        # Jump straight to the next occurrence of each pattern character
+        # with str.find instead of stepping through the text in Python
+        for char in pattern:
+            position = text.find(char, position + 1)
+            if position < 0:
+                break
+            # Characters match in sequence
+            score += max(30 - pattern_idx, 5)
+            pattern_idx += 1
 
         # Penalize if pattern wasn't fully matched
-        if pattern_idx < len(pattern):
-            score = max(0, score - (len(pattern) - pattern_idx) * 10)
+        if pattern_idx < pattern_len:
+            score = max(0, score - (pattern_len - pattern_idx) * 10)
 
         return min(score, 60)
 
-    def _matches_word_boundaries(self, name, query_parts):
-        """Check if query parts match word boundaries (e.g., initials)"""
-        name_words = name.split()
+    def _matches_word_boundaries(self, name_words, query_parts):
+        """Check if query parts match word boundaries (e.g., initials)
 
+        Both arguments are pre-split, lowercased word lists so the caller's
+        tokenization is reused instead of splitting the name again.
+        """
         if len(query_parts) > 1 and len(name_words) >= len(query_parts):
-            # Check if query parts match first letters of name words
-            matches = 0
-            for i, query_part in enumerate(query_parts):
-                if i < len(name_words):
-                    if name_words[i].startswith(query_part):
-                        matches += 1
+            # Check if query parts match first letters of name words; the
+            # length check above means zip never cuts the query short
+            matches = sum(1 for name_word, query_part in zip(name_words, query_parts)
+                          if name_word.startswith(query_part))
 
-            # If most query parts match word starts, return True
-            return matches >= len(query_parts) * 0.7
+            # If most (70%) query parts match word starts, return True
+            return matches * 10 >= len(query_parts) * 7
 
         return False
 
     def get_defense_stats(self, team_id):
         """Get defensive statistics for a team"""
         try:
-            response = requests.get(
+            response = self._session.get(
                 f'{self.base_url}/teams/{team_id}',
-                headers=self._get_headers(),
                 timeout=self.REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.Timeout:
-            logger.error(f"Timeout getting defense stats for team {team_id}")
+            logger.error("Timeout getting defense stats for team %s", team_id)
             return None
         except Exception as e:
-            logger.error(f"Failed to get defense stats for team {team_id}: {e}")
+            logger.error("Failed to get defense stats for team %s: %s", team_id, e)
             return None
 
     def get_weather_data(self, location):
         """Get current weather for a location"""
         try:
-            response = requests.get(
+            response = self._session.get(
                 f'{self.base_url}/weather/current',
                 params={'location': location},
-                headers=self._get_headers(),
                 timeout=self.REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.Timeout:
-            logger.error(f"Timeout getting weather data for {location}")
+            logger.error("Timeout getting weather data for %s", location)
             return None
         except Exception as e:
-            logger.error(f"Failed to get weather data for {location}: {e}")
+            logger.error("Failed to get weather data for %s: %s", location, e)
             return None
 
     def get_player_career_stats(self, player_id):
         """Get career statistics for a player"""
         try:
-            response = requests.get(
+            response = self._session.get(
                 f'{self.base_url}/players/{player_id}/career',
-                headers=self._get_headers(),
                 timeout=self.REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.Timeout:
-            logger.error(f"Timeout getting career stats for player {player_id}")
+            logger.error("Timeout getting career stats for player %s", player_id)
             return None
         except Exception as e:
-            logger.error(f"Failed to get career stats for player {player_id}: {e}")
+            logger.error("Failed to get career stats for player %s: %s", player_id, e)
             return None
 
+    def get_matchup_bundle(self, player_id, team_id, location=None):
+        """
+        Fetch everything a single matchup analysis needs at once.
+
+        The API has no combined endpoint, so the player, career, defense and
+        weather requests are issued concurrently; wall time is roughly the
+        slowest call rather than the sum of all four.
+
+        Args:
+            player_id: Player ID
+            team_id: Opponent team ID or abbreviation
+            location: Optional game location for weather data
+
+        Returns:
+            Dictionary with 'player', 'career', 'defense' and 'weather' keys,
+            each holding what the individual getter returns (None on failure)
+        """
+        calls = {
+            'player': (self.get_player_data, player_id),
+            'career': (self.get_player_career_stats, player_id),
+            'defense': (self.get_defense_stats, team_id),
+        }
+        if location:
+            calls['weather'] = (self.get_weather_data, location)
+
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = {key: executor.submit(fetch, arg) for key, (fetch, arg) in calls.items()}
+            bundle = {key: future.result() for key, future in futures.items()}
+
+        bundle.setdefault('weather', None)
+        return bundle
+
+    def prefetch_player_bundle(self, player_id, season=2024):
+        """
+        Fetch the data a player dashboard shows, all at once.
+
+        Advanced stats, injuries, team history and AI insights come from
+        separate endpoints, so they are requested concurrently; wall time is
+        roughly the slowest call rather than the sum of all four.
+
+        Args:
+            player_id: Player ID
+            season: Season year for the advanced stats
+
+        Returns:
+            Dictionary with 'advanced_stats', 'injuries', 'team_history' and
+            'insights' keys, each holding what the individual getter returns
+        """
+        advanced_stats, injuries, team_history, insights = self.fetch_many([
+            (self.get_player_advanced_stats, (player_id,), {'season': season}),
+            (self.get_player_injuries_v2, (player_id,), {}),
+            (self.get_player_team_history_v2, (player_id,), {}),
+            (self.ai_player_insights_v2, (player_id,), {}),
+        ])
+        return {
+            'advanced_stats': advanced_stats,
+            'injuries': injuries,
+            'team_history': team_history,
+            'insights': insights,
+        }
+
+    def _get_player_game_log(self, player_id):
+        """
+        Get a player's last GAME_LOG_LIMIT games, reusing a recent fetch
+
+        Matchup analysis asks for the same players' logs several times in a
+        short window, so the log is cached briefly. Raises on request failure.
+        """
+        def fetch_games():
+            # Fetch player's game logs
+            return self._request(
+                'GET',
+                f'/players/{player_id}/games',
+                params={'limit': self.GAME_LOG_LIMIT},
+                default=[]
+            )
+
+        return self._games_cache.get_or_load(
+            str(player_id),
+            lambda: self._coalesce(('games', str(player_id)), fetch_games)
+        )
+
     def get_player_recent_games(self, player_id, limit=20):
         """
         Get recent game logs for a player.
@@ -403,22 +1532,24 @@ class FantasyAPIClient:
         Returns:
             List of recent game stats
         """
-        import logging
-        logger = logging.getLogger(__name__)
+        # A recently fetched game log (see get_player_stats_vs_team) already
+        # holds the most recent games
+        cached = self._games_cache.get(str(player_id))
+        if cached is not None and limit <= self.GAME_LOG_LIMIT:
+            return cached[:limit]
 
         try:
-            response = requests.get(
-                f'{self.base_url}/players/{player_id}/games',
+            games = self._request(
+                'GET',
+                f'/players/{player_id}/games',
                 params={'limit': limit},
-                headers=self._get_headers(),
-                timeout=10
+                timeout=10,
+                default=[]
             )
-            response.raise_for_status()
-            games = response.json().get('data', [])
-            logger.info(f"Fetched {len(games)} recent games for player {player_id}")
+            logger.info("Fetched %d recent games for player %s", len(games), player_id)
             return games
         except Exception as e:
-            logger.error(f"Failed to fetch recent games for player {player_id}: {e}")
+            logger.error("Failed to fetch recent games for player %s: %s", player_id, e)
             return []
 
     def get_weekly_schedule(self, season, week):
@@ -426,29 +1557,33 @@ class FantasyAPIClient:
         Get NFL schedule for a specific week.
         Returns matchups showing which teams are playing each other.
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         cache_key = f"{season}_{week}"
         if cache_key in self._schedule_cache:
             return self._schedule_cache[cache_key]
 
+        shared_key = f"nflapi:sched:{season}:{week}"
+        games = cache_get_json(shared_key)
+        if games:
+            self._schedule_cache[cache_key] = games
+            return games
+
         try:
-            response = requests.get(
+            response = self._session.get(
                 f'{self.base_url}/games',
                 params={'season': season, 'week': week, 'limit': 100},
-                headers=self._get_headers(),
                 timeout=self.REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            games = response.json().get('data') or []
+            games = _json_loads(response.content).get('data') or []
             if games is None:
                 games = []
-            logger.info(f"Fetched {len(games)} games for {season} Week {week}")
+            logger.info("Fetched %d games for %s Week %s", len(games), season, week)
             self._schedule_cache[cache_key] = games
+            if games:
+                cache_set_json(shared_key, games, self.SCHEDULE_CACHE_EXPIRY)
             return games
         except Exception as e:
-            logger.error(f"Failed to fetch schedule for {season} Week {week}: {e}")
+            logger.error("Failed to fetch schedule for %s Week %s: %s", season, week, e)
             return []
 
     def get_team_opponent(self, team_abbr, season, week):
@@ -456,29 +1591,31 @@ class FantasyAPIClient:
         Get the opponent team for a given team in a specific week.
         Returns opponent team abbreviation or None.
         """
-        games = self.get_weekly_schedule(season, week)
+        games, teams_map = self._with_teams(self.get_weekly_schedule, season, week)
         if not games:
             return None
 
-        teams_map = self._get_teams()
-
-        # Reverse map to get team_id from abbreviation
-        abbr_to_id = {abbr: tid for tid, abbr in teams_map.items()}
-        team_id = abbr_to_id.get(team_abbr)
+        team_id = self._get_team_id(team_abbr)
 
         if not team_id:
             return None
 
-        for game in games:
-            home_team_id = game.get('home_team_id')
-            away_team_id = game.get('away_team_id')
-
-            if home_team_id == team_id:
-                return teams_map.get(away_team_id)
-            elif away_team_id == team_id:
-                return teams_map.get(home_team_id)
-
-        return None
+        cache_key = f"{season}_{week}"
+        opponents = self._opponents_cache.get(cache_key)
+        if opponents is None:
+            # Index the week once so every roster player is a dict lookup;
+            # setdefault keeps the first game listed for a team
+            opponents = {}
+            for game in games:
+                home_team_id = game.get('home_team_id')
+                away_team_id = game.get('away_team_id')
+                opponents.setdefault(home_team_id, away_team_id)
+                opponents.setdefault(away_team_id, home_team_id)
+            self._opponents_cache[cache_key] = opponents
+
+        if team_id not in opponents:
+            return None
+        return teams_map.get(opponents[team_id])
 
     def get_player_stats_vs_team(self, player_id, opponent_team_abbr):
         """
@@ -486,20 +1623,10 @@ class FantasyAPIClient:
         Returns summary of performance in past matchups.
         """
         try:
-            # Fetch player's game logs
-            response = requests.get(
-                f'{self.base_url}/players/{player_id}/games',
-                params={'limit': 100},  # Last 100 games
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            games = response.json().get('data', [])
+            games, _ = self._with_teams(self._get_player_game_log, player_id)
 
             # Get team_id for opponent
-            teams_map = self._get_teams()
-            abbr_to_id = {abbr: tid for tid, abbr in teams_map.items()}
-            opponent_team_id = abbr_to_id.get(opponent_team_abbr)
+            opponent_team_id = self._get_team_id(opponent_team_abbr)
 
             if not opponent_team_id:
                 return None
@@ -521,10 +1648,10 @@ class FantasyAPIClient:
                 'recent_games': vs_games[:3]  # Last 3 games vs this team
             }
         except requests.Timeout:
-            logger.error(f"Timeout getting player {player_id} stats vs team {opponent_team_abbr}")
+            logger.error("Timeout getting player %s stats vs team %s", player_id, opponent_team_abbr)
             return None
         except Exception as e:
-            logger.error(f"Failed to fetch player vs team stats: {e}")
+            logger.error("Failed to fetch player vs team stats: %s", e)
             return None
 
     def get_defensive_coordinator(self, team_abbr, season=2025):
@@ -534,14 +1661,10 @@ class FantasyAPIClient:
         """
         try:
             # Try to fetch from coaching staff API endpoint
-            response = requests.get(
+            coaches_data = self._get_static_json(
                 f'{self.base_url}/teams/{team_abbr}/coaches',
-                params={'season': season},
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            coaches_data = response.json().get('data', {})
+                params={'season': season}
+            ).get('data', {})
             
             # Look for defensive coordinator
             for coach in coaches_data.get('coaches', []):
@@ -549,31 +1672,14 @@ class FantasyAPIClient:
                     return coach.get('name', 'Unknown')
                     
         except requests.Timeout:
-            logger.warning(f"Timeout fetching coaching staff for {team_abbr}")
+            logger.warning("Timeout fetching coaching staff for %s", team_abbr)
         except Exception as e:
-            logger.debug(f"Could not fetch coaching staff from API for {team_abbr}: {e}")
+            logger.debug("Could not fetch coaching staff from API for %s: %s", team_abbr, e)
         
         # Fallback to 2024 cached mapping (updated periodically)
-        dc_mapping_2024 = {
-            'SF': 'Nick Sorensen',
-            'BAL': 'Zach Orr', 
-            'BUF': 'Bobby Babich',
-            'DAL': 'Mike Zimmer',
-            'PIT': 'Teryl Austin',
-            'CLE': 'Jim Schwartz',
-            'NYJ': 'Jeff Ulbrich',
-            'KC': 'Steve Spagnuolo',
-            'PHI': 'Vic Fangio',
-            'MIA': 'Anthony Weaver',
-            'DET': 'Aaron Glenn',
-            'GB': 'Jeff Hafley',
-            'MIN': 'Brian Flores',
-            'HOU': 'Matt Burke'
-        }
-        
-        coordinator = dc_mapping_2024.get(team_abbr)
+        coordinator = _DC_MAPPING_2024.get(team_abbr)
         if coordinator:
-            logger.debug(f"Using cached DC for {team_abbr}: {coordinator}")
+            logger.debug("Using cached DC for %s: %s", team_abbr, coordinator)
         return coordinator or 'Unknown'
 
     def get_key_defensive_players(self, team_abbr, position_group='ALL'):
@@ -589,24 +1695,14 @@ class FantasyAPIClient:
         """
         try:
             # Try to fetch from team roster API
-            response = requests.get(
+            roster_data = self._get_static_json(
                 f'{self.base_url}/teams/{team_abbr}/players',
-                params={'position_side': 'defense'},
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            roster_data = response.json().get('data', [])
+                params={'position_side': 'defense'}
+            ).get('data', [])
             
             # Filter by position group if specified
-            position_map = {
-                'DL': ['DE', 'DT', 'NT'],
-                'LB': ['LB', 'MLB', 'OLB', 'ILB'],
-                'DB': ['CB', 'S', 'SS', 'FS', 'DB']
-            }
-            
-            if position_group != 'ALL' and position_group in position_map:
-                target_positions = position_map[position_group]
+            if position_group != 'ALL' and position_group in _DEFENSIVE_POSITION_GROUPS:
+                target_positions = _DEFENSIVE_POSITION_GROUPS[position_group]
                 filtered_players = [
                     p.get('name') for p in roster_data 
                     if p.get('position') in target_positions
@@ -619,56 +1715,24 @@ class FantasyAPIClient:
                 return all_defenders[:5] if all_defenders else []
                 
         except requests.Timeout:
-            logger.warning(f"Timeout fetching roster for {team_abbr}")
+            logger.warning("Timeout fetching roster for %s", team_abbr)
         except Exception as e:
-            logger.debug(f"Could not fetch roster from API for {team_abbr}: {e}")
+            logger.debug("Could not fetch roster from API for %s: %s", team_abbr, e)
         
         # Fallback to cached 2024 key defenders (top impact players)
-        key_defenders_2024 = {
-            'SF': {
-                'DL': ['Nick Bosa', 'Javon Hargrave'],
-                'LB': ['Fred Warner', 'Dre Greenlaw'],
-                'DB': ['Charvarius Ward', 'Talanoa Hufanga']
-            },
-            'BAL': {
-                'DL': ['Justin Madubuike'],
-                'LB': ['Roquan Smith', 'Kyle Van Noy'],
-                'DB': ['Marlon Humphrey', 'Kyle Hamilton']
-            },
-            'BUF': {
-                'DL': ['Ed Oliver', 'Von Miller'],
-                'LB': ['Terrel Bernard', 'Matt Milano'],
-                'DB': ['Tre\'Davious White', 'Jordan Poyer']
-            },
-            'DAL': {
-                'DL': ['Micah Parsons', 'DeMarcus Lawrence'],
-                'LB': ['Leighton Vander Esch'],
-                'DB': ['Trevon Diggs', 'DaRon Bland']
-            },
-            'PIT': {
-                'DL': ['T.J. Watt', 'Cameron Heyward'],
-                'LB': ['Alex Highsmith'],
-                'DB': ['Minkah Fitzpatrick', 'Patrick Peterson']
-            },
-            'KC': {
-                'DL': ['Chris Jones', 'George Karlaftis'],
-                'LB': ['Nick Bolton'],
-                'DB': ['Trent McDuffie', 'Justin Reid']
-            }
-        }
-
-        team_defense = key_defenders_2024.get(team_abbr, {})
+        team_defense = _KEY_DEFENDERS_2024.get(team_abbr, {})
 
         if position_group == 'ALL':
             all_players = []
             for group_players in team_defense.values():
                 all_players.extend(group_players)
-            logger.debug(f"Using cached key defenders for {team_abbr} (all positions)")
+            logger.debug("Using cached key defenders for %s (all positions)", team_abbr)
             return all_players
 
-        players = team_defense.get(position_group, [])
+        # Copy so callers never get the shared module-level tuple
+        players = list(team_defense.get(position_group, ()))
         if players:
-            logger.debug(f"Using cached key defenders for {team_abbr} ({position_group})")
+            logger.debug("Using cached key defenders for %s (%s)", team_abbr, position_group)
         return players
 
     def get_team_roster(self, team_abbr, season=2024):
@@ -682,31 +1746,22 @@ class FantasyAPIClient:
         Returns:
             Dictionary with offensive players by position
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         try:
             # Get team_id from abbreviation
-            teams_map = self._get_teams()
-            abbr_to_id = {abbr: tid for tid, abbr in teams_map.items()}
-            team_id = abbr_to_id.get(team_abbr)
+            team_id = self._get_team_id(team_abbr)
 
             if not team_id:
-                logger.warning(f"Team not found: {team_abbr}")
+                logger.warning("Team not found: %s", team_abbr)
                 return None
 
             # Fetch team roster
-            response = requests.get(
+            players = self._get_static_json(
                 f'{self.base_url}/teams/{team_id}/players',
-                params={'season': season, 'limit': 100},
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            players = response.json().get('data', [])
+                params={'season': season, 'limit': 100}
+            ).get('data', [])
 
             if not players:
-                logger.warning(f"No roster data for {team_abbr}")
+                logger.warning("No roster data for %s", team_abbr)
                 return None
 
             # Organize by position (focus on offensive skill positions)
@@ -732,11 +1787,11 @@ class FantasyAPIClient:
             for pos in roster:
                 roster[pos] = roster[pos][:3]  # Top 3 per position
 
-            logger.info(f"Fetched roster for {team_abbr}: {sum(len(v) for v in roster.values())} players")
+            logger.info("Fetched roster for %s: %d players", team_abbr, sum(len(v) for v in roster.values()))
             return roster
 
         except Exception as e:
-            logger.error(f"Failed to fetch roster for {team_abbr}: {e}")
+            logger.error("Failed to fetch roster for %s: %s", team_abbr, e)
             return None
 
     def get_team_defensive_rankings(self, team_abbr, season=2024):
@@ -750,37 +1805,34 @@ class FantasyAPIClient:
         Returns:
             Dictionary with defensive stats and rankings
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         try:
             # First, get team ID from abbreviation
-            teams = self._get_teams()
-            team_id = None
-            for tid, abbr in teams.items():
-                if abbr == team_abbr:
-                    team_id = tid
-                    break
+            team_id = self._get_team_id(team_abbr)
 
             if not team_id:
-                logger.warning(f"Team ID not found for {team_abbr}")
+                logger.warning("Team ID not found for %s", team_abbr)
                 return None
 
+            # Every roster player facing this defense asks for the same stats
+            cache_key = ('defensive_stats', team_id, season)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+
             # Try new defensive stats endpoint
-            response = requests.get(
+            response = self._session.get(
                 f'{self.base_url}/teams/{team_id}/defense/stats',
                 params={'season': season},
-                headers=self._get_headers(),
                 timeout=self.REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            stats_data = response.json()
+            stats_data = _json_loads(response.content)
 
             # Extract stats from response (should have 'data' wrapper)
             stats = stats_data.get('data', {})
 
             if not stats:
-                logger.warning(f"No data in defensive stats response for {team_abbr}")
+                logger.warning("No data in defensive stats response for %s", team_abbr)
                 return None
 
             # Extract defensive metrics using exact field names from API spec
@@ -804,17 +1856,18 @@ class FantasyAPIClient:
                 'red_zone_percentage': stats.get('red_zone_percentage', 0)
             }
 
-            logger.info(f"Fetched defensive stats for {team_abbr} from API: {defensive_stats}")
+            logger.info("Fetched defensive stats for %s from API: %s", team_abbr, defensive_stats)
+            self._cache_response(cache_key, defensive_stats, self.RANKINGS_CACHE_TTL)
             return defensive_stats
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
-                logger.warning(f"Defensive stats endpoint not found for {team_abbr} (404)")
+                logger.warning("Defensive stats endpoint not found for %s (404)", team_abbr)
             else:
-                logger.error(f"HTTP error fetching defensive rankings for {team_abbr}: {e}")
+                logger.error("HTTP error fetching defensive rankings for %s: %s", team_abbr, e)
             return None
         except Exception as e:
-            logger.error(f"Failed to fetch defensive rankings for {team_abbr}: {e}")
+            logger.error("Failed to fetch defensive rankings for %s: %s", team_abbr, e)
             return None
 
     def get_player_injury_history(self, player_id):
@@ -827,23 +1880,34 @@ class FantasyAPIClient:
         Returns:
             List of injury records with dates and descriptions
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         try:
-            response = requests.get(
-                f'{self.base_url}/players/{player_id}/injuries',
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            injuries = response.json().get('data', [])
-            logger.info(f"Fetched {len(injuries)} injury records for player {player_id}")
+            injuries = self._get_player_injuries(player_id)
+            logger.info("Fetched %d injury records for player %s", len(injuries), player_id)
             return injuries
         except Exception as e:
-            logger.error(f"Failed to fetch injury history for player {player_id}: {e}")
+            logger.error("Failed to fetch injury history for player %s: %s", player_id, e)
             return []
 
+    def _get_player_injuries(self, player_id):
+        """
+        Get a player's /injuries records, shared by the v1 and v2 methods
+
+        Both public methods read the same endpoint, so a dashboard calling
+        both (or several requests asking at once) makes one request.
+        Raises on request failure.
+        """
+        cache_key = ('player_injuries', str(player_id))
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        def fetch_injuries():
+            injuries = self._request('GET', f'/players/{player_id}/injuries', default=[])
+            self._cache_response(cache_key, injuries, self.INJURY_CACHE_TTL)
+            return injuries
+
+        return self._coalesce(cache_key, fetch_injuries)
+
     def get_weather_forecast(self, location, date=None):
         """
         Get weather forecast for upcoming games.
@@ -855,26 +1919,16 @@ class FantasyAPIClient:
         Returns:
             Weather forecast data
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         try:
             params = {'location': location}
             if date:
                 params['date'] = date
 
-            response = requests.get(
-                f'{self.base_url}/weather/forecast',
-                params=params,
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            forecast = response.json().get('data', {})
-            logger.info(f"Fetched weather forecast for {location}")
+            forecast = self._request('GET', '/weather/forecast', params=params, default={})
+            logger.info("Fetched weather forecast for %s", location)
             return forecast
         except Exception as e:
-            logger.error(f"Failed to fetch weather forecast for {location}: {e}")
+            logger.error("Failed to fetch weather forecast for %s: %s", location, e)
             return None
 
     def get_game_stats(self, game_id):
@@ -887,21 +1941,12 @@ class FantasyAPIClient:
         Returns:
             Comprehensive game statistics
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         try:
-            response = requests.get(
-                f'{self.base_url}/stats/game/{game_id}',
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            stats = response.json().get('data', {})
-            logger.info(f"Fetched stats for game {game_id}")
+            stats = self._request('GET', f'/stats/game/{game_id}', default={})
+            logger.info("Fetched stats for game %s", game_id)
             return stats
         except Exception as e:
-            logger.error(f"Failed to fetch stats for game {game_id}: {e}")
+            logger.error("Failed to fetch stats for game %s: %s", game_id, e)
             return None
 
     def get_stat_leaders(self, category='passing_yards', season=2024, limit=10):
@@ -916,22 +1961,23 @@ class FantasyAPIClient:
         Returns:
             List of top players in the category
         """
-        import logging
-        logger = logging.getLogger(__name__)
+        cache_key = ('stat_leaders', category, season, limit)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            response = requests.get(
-                f'{self.base_url}/stats/leaders',
+            leaders = self._request(
+                'GET',
+                '/stats/leaders',
                 params={'category': category, 'season': season, 'limit': limit},
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
+                default=[]
             )
-            response.raise_for_status()
-            leaders = response.json().get('data', [])
-            logger.info(f"Fetched {len(leaders)} leaders for {category}")
+            logger.info("Fetched %d leaders for %s", len(leaders), category)
+            self._cache_response(cache_key, leaders, self.RANKINGS_CACHE_TTL)
             return leaders
         except Exception as e:
-            logger.error(f"Failed to fetch stat leaders for {category}: {e}")
+            logger.error("Failed to fetch stat leaders for %s: %s", category, e)
             return []
 
     def ai_garden_query(self, query):
@@ -944,22 +1990,12 @@ class FantasyAPIClient:
         Returns:
             AI-generated response with data insights
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         try:
-            response = requests.post(
-                f'{self.base_url}/garden/query',
-                json={'query': query},
-                headers=self._get_headers(include_api_key=True),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            result = response.json().get('data', {})
-            logger.info(f"AI Garden query successful: {query[:50]}...")
+            result = self._ai_request('POST', '/garden/query', json={'query': query}, default={})
+            logger.info("AI Garden query successful: %s...", query[:50])
             return result
         except Exception as e:
-            logger.error(f"AI Garden query failed: {e}")
+            logger.error("AI Garden query failed: %s", e)
             return None
 
     def ai_garden_enrich_player(self, player_id):
@@ -972,21 +2008,12 @@ class FantasyAPIClient:
         Returns:
             AI-enriched player data
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         try:
-            response = requests.post(
-                f'{self.base_url}/garden/enrich/player/{player_id}',
-                headers=self._get_headers(include_api_key=True),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            enriched = response.json().get('data', {})
-            logger.info(f"AI enrichment successful for player {player_id}")
+            enriched = self._ai_request('POST', f'/garden/enrich/player/{player_id}', default={})
+            logger.info("AI enrichment successful for player %s", player_id)
             return enriched
         except Exception as e:
-            logger.error(f"AI enrichment failed for player {player_id}: {e}")
+            logger.error("AI enrichment failed for player %s: %s", player_id, e)
             return None
 
     # ========================================
@@ -1013,9 +2040,6 @@ class FantasyAPIClient:
             - Rushing/receiving yards after catch
             - Route running metrics
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
             params = {'season': season}
             if week:
@@ -1023,18 +2047,19 @@ class FantasyAPIClient:
             if stat_type:
                 params['stat_type'] = stat_type
             
-            response = requests.get(
-                f'{self.base_url}/players/{player_id}/advanced-stats',
+            stats = self._request(
+                'GET',
+                f'/players/{player_id}/advanced-stats',
                 params=params,
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
+                default={}
+            )
+            logger.info(
+                "Fetched advanced stats for player %s (season: %s, week: %s)",
+                player_id, season, week
             )
-            response.raise_for_status()
-            stats = response.json().get('data', {})
-            logger.info(f"Fetched advanced stats for player {player_id} (season: {season}, week: {week})")
             return stats
         except Exception as e:
-            logger.error(f"Failed to fetch advanced stats for player {player_id}: {e}")
+            logger.error("Failed to fetch advanced stats for player %s: %s", player_id, e)
             return None
 
     def get_game_play_by_play(self, game_id):
@@ -1055,21 +2080,12 @@ class FantasyAPIClient:
             - Time remaining
             - Field position
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
-            response = requests.get(
-                f'{self.base_url}/games/{game_id}/play-by-play',
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            plays = response.json().get('data', [])
-            logger.info(f"Fetched {len(plays)} plays for game {game_id}")
+            plays = self._request('GET', f'/games/{game_id}/play-by-play', default=[])
+            logger.info("Fetched %d plays for game %s", len(plays), game_id)
             return plays
         except Exception as e:
-            logger.error(f"Failed to fetch play-by-play for game {game_id}: {e}")
+            logger.error("Failed to fetch play-by-play for game %s: %s", game_id, e)
             return []
 
     def get_game_scoring_plays(self, game_id):
@@ -1089,21 +2105,12 @@ class FantasyAPIClient:
             - Time
             - Quarter
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
-            response = requests.get(
-                f'{self.base_url}/games/{game_id}/scoring-plays',
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            scoring = response.json().get('data', [])
-            logger.info(f"Fetched {len(scoring)} scoring plays for game {game_id}")
+            scoring = self._request('GET', f'/games/{game_id}/scoring-plays', default=[])
+            logger.info("Fetched %d scoring plays for game %s", len(scoring), game_id)
             return scoring
         except Exception as e:
-            logger.error(f"Failed to fetch scoring plays for game {game_id}: {e}")
+            logger.error("Failed to fetch scoring plays for game %s: %s", game_id, e)
             return []
 
     def get_team_injuries_v2(self, team_id):
@@ -1123,21 +2130,18 @@ class FantasyAPIClient:
             - Last update timestamp
             - Expected return date (if available)
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
+        cache_key = ('team_injuries', team_id)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(
-                f'{self.base_url}/teams/{team_id}/injuries',
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            injuries = response.json().get('data', [])
-            logger.info(f"Fetched {len(injuries)} injury reports for team {team_id}")
+            injuries = self._request('GET', f'/teams/{team_id}/injuries', default=[])
+            logger.info("Fetched %d injury reports for team %s", len(injuries), team_id)
+            self._cache_response(cache_key, injuries, self.INJURY_CACHE_TTL)
             return injuries
         except Exception as e:
-            logger.error(f"Failed to fetch injuries for team {team_id}: {e}")
+            logger.error("Failed to fetch injuries for team %s: %s", team_id, e)
             return []
 
     def get_player_injuries_v2(self, player_id):
@@ -1156,24 +2160,15 @@ class FantasyAPIClient:
             - Recovery timeline
             - Practice participation
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
-            response = requests.get(
-                f'{self.base_url}/players/{player_id}/injuries',
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            injuries = response.json().get('data', [])
-            logger.info(f"Fetched {len(injuries)} injury records for player {player_id}")
+            injuries = self._get_player_injuries(player_id)
+            logger.info("Fetched %d injury records for player %s", len(injuries), player_id)
             return injuries
         except Exception as e:
-            logger.error(f"Failed to fetch injuries for player {player_id}: {e}")
+            logger.error("Failed to fetch injuries for player %s: %s", player_id, e)
             return []
 
-    def get_team_schedule_v2(self, team_id, season=2024):
+    def get_team_schedule_v2(self, team_id, season=2024, fields=None):
         """
         Get complete season schedule for a team (enhanced v2 endpoint).
         
@@ -1182,6 +2177,8 @@ class FantasyAPIClient:
         Args:
             team_id: Team ID or abbreviation
             season: Season year
+            fields: Optional list of response fields to return (sent as
+                fields=a,b,c), for callers that only need a few of them
         
         Returns:
             Complete schedule with:
@@ -1191,22 +2188,27 @@ class FantasyAPIClient:
             - Game results (if completed)
             - Bye weeks
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
+        if not _is_valid_id(team_id):
+            return []
+        cache_key = ('team_schedule', team_id, season, tuple(fields) if fields else None)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(
+            params = {'season': season}
+            if fields:
+                params['fields'] = ','.join(fields)
+            schedule = self._get_static_json(
                 f'{self.base_url}/teams/{team_id}/schedule',
-                params={'season': season},
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            schedule = response.json().get('data', [])
-            logger.info(f"Fetched schedule for team {team_id} ({season}): {len(schedule)} games")
+                params=params,
+                timeout=self.SCHEDULE_TIMEOUT
+            ).get('data', [])
+            logger.info("Fetched schedule for team %s (%s): %d games", team_id, season, len(schedule))
+            self._cache_response(cache_key, schedule, self.TEAM_SCHEDULE_CACHE_TTL)
             return schedule
         except Exception as e:
-            logger.error(f"Failed to fetch schedule for team {team_id}: {e}")
+            logger.error("Failed to fetch schedule for team %s: %s", team_id, e)
             return []
 
     def get_defense_rankings_v2(self, category='overall', season=2024):
@@ -1226,22 +2228,23 @@ class FantasyAPIClient:
             - Strength of schedule adjustments
             - Advanced metrics (EPA allowed, success rate, etc.)
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
+        cache_key = ('defense_rankings', category, season)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(
-                f'{self.base_url}/defense/rankings',
+            rankings = self._request(
+                'GET',
+                '/defense/rankings',
                 params={'category': category, 'season': season},
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
+                default=[]
             )
-            response.raise_for_status()
-            rankings = response.json().get('data', [])
-            logger.info(f"Fetched defensive rankings for {category} ({season}): {len(rankings)} teams")
+            logger.info("Fetched defensive rankings for %s (%s): %d teams", category, season, len(rankings))
+            self._cache_response(cache_key, rankings, self.RANKINGS_CACHE_TTL)
             return rankings
         except Exception as e:
-            logger.error(f"Failed to fetch defense rankings ({category}): {e}")
+            logger.error("Failed to fetch defense rankings (%s): %s", category, e)
             return []
 
     def get_standings_v2(self, season=2024, division=None):
@@ -1262,26 +2265,25 @@ class FantasyAPIClient:
             - Strength of victory/schedule
             - Tiebreaker info
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
+        cache_key = ('standings', season, division)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             params = {'season': season}
             if division:
                 params['division'] = division
             
-            response = requests.get(
+            standings = self._get_static_json(
                 f'{self.base_url}/standings',
-                params=params,
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            standings = response.json().get('data', [])
-            logger.info(f"Fetched standings for {season} (division: {division})")
+                params=params
+            ).get('data', [])
+            logger.info("Fetched standings for %s (division: %s)", season, division)
+            self._cache_response(cache_key, standings, self.RANKINGS_CACHE_TTL)
             return standings
         except Exception as e:
-            logger.error(f"Failed to fetch standings ({season}): {e}")
+            logger.error("Failed to fetch standings (%s): %s", season, e)
             return []
 
     def ai_predict_game_v2(self, game_id):
@@ -1302,21 +2304,17 @@ class FantasyAPIClient:
             - Player impact projections
             - Claude-powered insights
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
-            response = requests.get(
-                f'{self.base_url}/ai/predict/game/{game_id}',
-                headers=self._get_headers(include_api_key=True),
-                timeout=30  # AI endpoints may take longer
+            prediction = self._ai_request(
+                'GET',
+                f'/ai/predict/game/{game_id}',
+                timeout=30,  # AI endpoints may take longer
+                default={}
             )
-            response.raise_for_status()
-            prediction = response.json().get('data', {})
-            logger.info(f"Fetched AI game prediction for game {game_id}")
+            logger.info("Fetched AI game prediction for game %s", game_id)
             return prediction
         except Exception as e:
-            logger.error(f"Failed to fetch AI game prediction for {game_id}: {e}")
+            logger.error("Failed to fetch AI game prediction for %s: %s", game_id, e)
             return None
 
     def ai_predict_player_v2(self, player_id, game_context=None):
@@ -1338,24 +2336,20 @@ class FantasyAPIClient:
             - Opportunity analysis
             - Claude-powered narrative insights
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
             params = game_context if game_context else {}
             
-            response = requests.get(
-                f'{self.base_url}/ai/predict/player/{player_id}',
+            prediction = self._ai_request(
+                'GET',
+                f'/ai/predict/player/{player_id}',
                 params=params,
-                headers=self._get_headers(include_api_key=True),
-                timeout=30  # AI endpoints may take longer
+                timeout=30,  # AI endpoints may take longer
+                default={}
             )
-            response.raise_for_status()
-            prediction = response.json().get('data', {})
-            logger.info(f"Fetched AI player prediction for player {player_id}")
+            logger.info("Fetched AI player prediction for player %s", player_id)
             return prediction
         except Exception as e:
-            logger.error(f"Failed to fetch AI player prediction for {player_id}: {e}")
+            logger.error("Failed to fetch AI player prediction for %s: %s", player_id, e)
             return None
 
     def ai_player_insights_v2(self, player_id):
@@ -1376,21 +2370,17 @@ class FantasyAPIClient:
             - Trade value assessment
             - Claude-powered narrative analysis
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
-            response = requests.get(
-                f'{self.base_url}/ai/insights/player/{player_id}',
-                headers=self._get_headers(include_api_key=True),
-                timeout=30  # AI endpoints may take longer
+            insights = self._ai_request(
+                'GET',
+                f'/ai/insights/player/{player_id}',
+                timeout=30,  # AI endpoints may take longer
+                default={}
             )
-            response.raise_for_status()
-            insights = response.json().get('data', {})
-            logger.info(f"Fetched AI insights for player {player_id}")
+            logger.info("Fetched AI insights for player %s", player_id)
             return insights
         except Exception as e:
-            logger.error(f"Failed to fetch AI insights for player {player_id}: {e}")
+            logger.error("Failed to fetch AI insights for player %s: %s", player_id, e)
             return None
 
     def ai_query_v2(self, query):
@@ -1415,22 +2405,18 @@ class FantasyAPIClient:
             - "Compare Patrick Mahomes vs Josh Allen passing stats"
             - "Which defenses are best against tight ends?"
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
-            response = requests.post(
-                f'{self.base_url}/ai/query',
+            result = self._ai_request(
+                'POST',
+                '/ai/query',
                 json={'query': query},
-                headers=self._get_headers(include_api_key=True),
-                timeout=30  # AI endpoints may take longer
+                timeout=30,  # AI endpoints may take longer
+                default={}
             )
-            response.raise_for_status()
-            result = response.json().get('data', {})
-            logger.info(f"AI query successful: {query[:50]}...")
+            logger.info("AI query successful: %s...", query[:50])
             return result
         except Exception as e:
-            logger.error(f"AI query failed ({query[:30]}...): {e}")
+            logger.error("AI query failed (%s...): %s", query[:30], e)
             return None
 
     def get_games_v2(self, season=None, week=None, team=None, status=None, limit=50):
@@ -1449,9 +2435,6 @@ class FantasyAPIClient:
         Returns:
             List of games with enhanced metadata
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
             params = {'limit': limit}
             if season:
@@ -1463,21 +2446,20 @@ class FantasyAPIClient:
             if status:
                 params['status'] = status
             
-            response = requests.get(
+            response = self._session.get(
                 f'{self.base_url}/games',
                 params=params,
-                headers=self._get_headers(),
                 timeout=self.REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             games = data.get('data', [])
             meta = data.get('meta', {})
             
-            logger.info(f"Fetched {len(games)} games (total: {meta.get('total', 'unknown')})")
+            logger.info("Fetched %d games (total: %s)", len(games), meta.get('total', 'unknown'))
             return games
         except Exception as e:
-            logger.error(f"Failed to fetch games: {e}")
+            logger.error("Failed to fetch games: %s", e)
             return []
 
     def get_game_details_v2(self, game_id):
@@ -1499,21 +2481,12 @@ class FantasyAPIClient:
             - Stadium info
             - Betting lines (if available)
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
-            response = requests.get(
-                f'{self.base_url}/games/{game_id}',
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            game = response.json().get('data', {})
-            logger.info(f"Fetched details for game {game_id}")
+            game = self._request('GET', f'/games/{game_id}', default={})
+            logger.info("Fetched details for game %s", game_id)
             return game
         except Exception as e:
-            logger.error(f"Failed to fetch game details for {game_id}: {e}")
+            logger.error("Failed to fetch game details for %s: %s", game_id, e)
             return None
 
     def get_team_roster_v2(self, team_id, season=2024):
@@ -1534,22 +2507,15 @@ class FantasyAPIClient:
             - Jersey numbers
             - Status
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
-            response = requests.get(
+            roster = self._get_static_json(
                 f'{self.base_url}/teams/{team_id}/roster',
-                params={'season': season},
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            roster = response.json().get('data', [])
-            logger.info(f"Fetched roster for team {team_id} ({season}): {len(roster)} players")
+                params={'season': season}
+            ).get('data', [])
+            logger.info("Fetched roster for team %s (%s): %d players", team_id, season, len(roster))
             return roster
         except Exception as e:
-            logger.error(f"Failed to fetch roster for team {team_id}: {e}")
+            logger.error("Failed to fetch roster for team %s: %s", team_id, e)
             return []
 
     # ========================================================================
@@ -1582,18 +2548,11 @@ class FantasyAPIClient:
             if team:
                 params['team'] = team
             
-            response = requests.get(
-                f'{self.base_url}/players',
-                params=params,
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            data = response.json().get('data', [])
-            logger.info(f"Fetched {len(data)} players (position={position}, status={status})")
+            data = self._request('GET', '/players', params=params, default=[])
+            logger.info("Fetched %d players (position=%s, status=%s)", len(data), position, status)
             return data
         except Exception as e:
-            logger.error(f"Failed to fetch players list: {e}")
+            logger.error("Failed to fetch players list: %s", e)
             return []
 
     def get_teams_list_v2(self):
@@ -1610,18 +2569,18 @@ class FantasyAPIClient:
             - Conference and division
             - Colors, logos
         """
+        cache_key = ('teams_list',)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(
-                f'{self.base_url}/teams',
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            teams = response.json().get('data', [])
-            logger.info(f"Fetched {len(teams)} NFL teams")
+            teams = self._get_static_json(f'{self.base_url}/teams').get('data', [])
+            logger.info("Fetched %d NFL teams", len(teams))
+            self._cache_response(cache_key, teams, self.TEAM_INFO_CACHE_TTL)
             return teams
         except Exception as e:
-            logger.error(f"Failed to fetch teams list: {e}")
+            logger.error("Failed to fetch teams list: %s", e)
             return []
 
     def get_team_by_id_v2(self, team_id):
@@ -1641,21 +2600,21 @@ class FantasyAPIClient:
             - Historical data
             - Current season record
         """
+        cache_key = ('team', team_id)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(
-                f'{self.base_url}/teams/{team_id}',
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            team = response.json().get('data', {})
-            logger.info(f"Fetched details for team {team_id}")
+            team = self._request('GET', f'/teams/{team_id}', default={})
+            logger.info("Fetched details for team %s", team_id)
+            self._cache_response(cache_key, team, self.TEAM_INFO_CACHE_TTL)
             return team
         except Exception as e:
-            logger.error(f"Failed to fetch team details for {team_id}: {e}")
+            logger.error("Failed to fetch team details for %s: %s", team_id, e)
             return None
 
-    def get_player_team_history_v2(self, player_id):
+    def get_player_team_history_v2(self, player_id, fields=None):
         """
         Get player's team history (API v2).
         
@@ -1663,6 +2622,8 @@ class FantasyAPIClient:
         
         Args:
             player_id: Player UUID
+            fields: Optional list of response fields to return (sent as
+                fields=a,b,c), for callers that only need a few of them
         
         Returns:
             List of teams player has been on:
@@ -1671,21 +2632,48 @@ class FantasyAPIClient:
             - Position(s) played
             - Notable achievements
         """
+        if not _is_valid_id(player_id):
+            return []
+        cache_key = ('player_history', player_id, tuple(fields) if fields else None)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(
+            params = {'fields': ','.join(fields)} if fields else None
+            # A player's history rarely changes, so revalidate rather than re-download
+            history = self._get_static_json(
                 f'{self.base_url}/players/{player_id}/history',
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            history = response.json().get('data', [])
-            logger.info(f"Fetched team history for player {player_id}: {len(history)} teams")
+                params=params,
+                timeout=self.HISTORY_TIMEOUT
+            ).get('data', [])
+            logger.info("Fetched team history for player %s: %d teams", player_id, len(history))
+            self._cache_response(cache_key, history, self.PLAYER_HISTORY_CACHE_TTL)
             return history
         except Exception as e:
-            logger.error(f"Failed to fetch player team history for {player_id}: {e}")
+            logger.error("Failed to fetch player team history for %s: %s", player_id, e)
             return []
 
-    def get_player_vs_defense_v2(self, player_id, defense_team_id, season=None, limit=10):
+    def get_player_team_histories_batch_v2(self, player_ids):
+        """
+        Get team histories for several players at once (API v2).
+
+        Like get_players_vs_defense_batch_v2, the per-player lookups run
+        concurrently and duplicate IDs are fetched once.
+
+        Args:
+            player_ids: Iterable of player UUIDs
+
+        Returns:
+            Dictionary mapping each player ID to its team history
+        """
+        player_ids = list(dict.fromkeys(player_ids))
+        results = self.fetch_many(
+            (self.get_player_team_history_v2, (player_id,), {}) for player_id in player_ids
+        )
+        return dict(zip(player_ids, results))
+
+    def get_player_vs_defense_v2(self, player_id, defense_team_id, season=None, limit=10, fields=None):
         """
         Get player's performance vs specific defense (API v2).
         
@@ -1696,6 +2684,8 @@ class FantasyAPIClient:
             defense_team_id: Defending team UUID
             season: Optional season filter
             limit: Max games to return
+            fields: Optional list of response fields to return (sent as
+                fields=a,b,c), for callers that only need a few of them
         
         Returns:
             Historical performance data:
@@ -1704,26 +2694,62 @@ class FantasyAPIClient:
             - Fantasy points
             - Trends
         """
+        if not (_is_valid_id(player_id) and _is_valid_id(defense_team_id)):
+            return []
+        cache_key = ('vs_defense', player_id, defense_team_id, season, limit,
+                     tuple(fields) if fields else None)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             params = {'limit': limit}
             if season:
                 params['season'] = season
+            if fields:
+                params['fields'] = ','.join(fields)
             
-            response = requests.get(
-                f'{self.base_url}/players/{player_id}/vs-defense/{defense_team_id}',
+            performance = self._request(
+                'GET',
+                f'/players/{player_id}/vs-defense/{defense_team_id}',
                 params=params,
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
+                default=[],
+                timeout=self.VS_DEFENSE_TIMEOUT
             )
-            response.raise_for_status()
-            performance = response.json().get('data', [])
-            logger.info(f"Fetched vs defense stats for player {player_id} vs {defense_team_id}")
+            logger.info("Fetched vs defense stats for player %s vs %s", player_id, defense_team_id)
+            self._cache_response(cache_key, performance, self.VS_DEFENSE_CACHE_TTL)
             return performance
         except Exception as e:
-            logger.error(f"Failed to fetch player vs defense: {e}")
+            logger.error("Failed to fetch player vs defense: %s", e)
             return []
 
-    def get_game_team_stats_v2(self, game_id):
+    def get_players_vs_defense_batch_v2(self, pairs, season=None, limit=10, fields=None):
+        """
+        Get performance vs defense for several (player, defense) pairs.
+
+        The API has no batch endpoint, so the individual
+        get_player_vs_defense_v2 lookups run concurrently; wall time is
+        roughly the slowest lookup rather than the sum. Duplicate pairs are
+        fetched once.
+
+        Args:
+            pairs: Iterable of (player_id, defense_team_id) tuples
+            season: Optional season filter
+            limit: Max games to return per pair
+            fields: Optional list of response fields to return
+
+        Returns:
+            Dictionary mapping each (player_id, defense_team_id) pair to what
+            get_player_vs_defense_v2 returns for it
+        """
+        pairs = list(dict.fromkeys(pairs))
+        results = self.fetch_many(
+            (self.get_player_vs_defense_v2, pair, {'season': season, 'limit': limit, 'fields': fields})
+            for pair in pairs
+        )
+        return dict(zip(pairs, results))
+
+    def get_game_team_stats_v2(self, game_id, fields=None):
         """
         Get team statistics for a specific game (API v2).
         
@@ -1731,6 +2757,8 @@ class FantasyAPIClient:
         
         Args:
             game_id: Game UUID
+            fields: Optional list of response fields to return (sent as
+                fields=a,b,c), for callers that only need a few of them
         
         Returns:
             Team-level statistics for the game:
@@ -1741,18 +2769,27 @@ class FantasyAPIClient:
             - Red zone efficiency
             - Third down conversions
         """
+        if not _is_valid_id(game_id):
+            return None
+        cache_key = ('game_team_stats', game_id, tuple(fields) if fields else None)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(
-                f'{self.base_url}/games/{game_id}/stats',
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
+            params = {'fields': ','.join(fields)} if fields else None
+            stats = self._request(
+                'GET',
+                f'/games/{game_id}/stats',
+                params=params,
+                default={},
+                timeout=self.GAME_STATS_TIMEOUT
             )
-            response.raise_for_status()
-            stats = response.json().get('data', {})
-            logger.info(f"Fetched team stats for game {game_id}")
+            logger.info("Fetched team stats for game %s", game_id)
+            self._cache_response(cache_key, stats, self.GAME_STATS_CACHE_TTL)
             return stats
         except Exception as e:
-            logger.error(f"Failed to fetch game team stats for {game_id}: {e}")
+            logger.error("Failed to fetch game team stats for %s: %s", game_id, e)
             return None
 
     def get_player_by_id_v2(self, player_id):
@@ -1787,7 +2824,7 @@ class FantasyAPIClient:
         """
         return self.get_game_details_v2(game_id)
 
-    def get_team_schedule_detailed_v2(self, team_id, season=2024):
+    def get_team_schedule_detailed_v2(self, team_id, season=2024, fields=None):
         """
         Get detailed team schedule with game results (API v2).
         
@@ -1796,6 +2833,8 @@ class FantasyAPIClient:
         Args:
             team_id: Team UUID or abbreviation
             season: Season year
+            fields: Optional list of response fields to return (sent as
+                fields=a,b,c), for callers that only need a few of them
         
         Returns:
             Complete schedule with:
@@ -1803,18 +2842,8 @@ class FantasyAPIClient:
             - Results (if completed)
             - Opponent details
             - Game locations
+
+        This is an alias/wrapper for get_team_schedule_v2, which reads the
+        same endpoint, so both share its cache.
         """
-        try:
-            response = requests.get(
-                f'{self.base_url}/teams/{team_id}/schedule',
-                params={'season': season},
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            schedule = response.json().get('data', [])
-            logger.info(f"Fetched schedule for team {team_id} ({season}): {len(schedule)} games")
-            return schedule
-        except Exception as e:
-            logger.error(f"Failed to fetch schedule for team {team_id}: {e}")
-            return []
+        return self.get_team_schedule_v2(team_id, season, fields=fields)
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from app.services.season_service import SeasonService
 from app.services.api_client import FantasyAPIClient
@@ -12,6 +13,9 @@ class MatchupDataService:
     and gathering comprehensive matchup data for analysis
     """
 
+    # Max players whose matchup data is fetched concurrently
+    BULK_FETCH_WORKERS = 8
+
     def __init__(self):
         self.season_service = SeasonService()
         self.api_client = FantasyAPIClient()
@@ -250,26 +254,31 @@ class MatchupDataService:
         # First, map players to opponents
         player_mappings = self.get_player_opponent_mapping(roster_players, season, week)
 
-        # Then fetch comprehensive data for each matchup
-        analysis_data = []
-        for mapping in player_mappings:
+        def build_matchup_data(mapping):
             player = mapping['player']
             opponent = mapping.get('opponent_team')
 
             if mapping.get('has_game'):
                 # Fetch full data
-                comprehensive = self.get_comprehensive_matchup_data(player, opponent, season, week)
-                analysis_data.append(comprehensive)
-            else:
-                # Player has no game (bye week)
-                analysis_data.append({
-                    'player': player,
-                    'opponent': None,
-                    'season': season,
-                    'week': week,
-                    'has_game': False,
-                    'error': mapping.get('error', 'No game')
-                })
+                return self.get_comprehensive_matchup_data(player, opponent, season, week)
+            # Player has no game (bye week)
+            return {
+                'player': player,
+                'opponent': None,
+                'season': season,
+                'week': week,
+                'has_game': False,
+                'error': mapping.get('error', 'No game')
+            }
+
+        # Then fetch comprehensive data for each matchup. Each player's chain of
+        # API calls is independent of the others, so run them concurrently;
+        # map() keeps the results in roster order
+        analysis_data = []
+        if player_mappings:
+            workers = min(self.BULK_FETCH_WORKERS, len(player_mappings))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                analysis_data = list(executor.map(build_matchup_data, player_mappings))
 
         logger.info(f"Prepared analysis data for {len(analysis_data)} players")
         return analysis_data
@@ -5,7 +5,9 @@ Caches all active NFL players for fast client-side search
 
 import json
 import logging
-from app.services.api_client import FantasyAPIClient
+import threading
+import time
+from app.services.api_client import get_client
 from app.utils.cache import cache, CACHE_ENABLED
 from app.database import execute_query
 
@@ -14,6 +16,12 @@ logger = logging.getLogger(__name__)
 CACHE_KEY = 'all_active_players'
 CACHE_EXPIRY = 86400  # 24 hours
 
+# Normalized search indexes per position filter, reused across keystrokes so a
+# search doesn't reload and re-normalize the whole player cache every time
+SEARCH_INDEX_TTL = 60  # seconds
+_search_indexes = {}
+_search_indexes_lock = threading.Lock()
+
 def get_cached_players():
     """Get all cached players (from Redis or PostgreSQL)"""
     # Try Redis first
@@ -59,14 +67,15 @@ def cache_all_players(force=False):
             return cached
 
     logger.info("Fetching all active players from API...")
-    api_client = FantasyAPIClient()
+    api_client = get_client()
     all_players = []
     positions = ['QB', 'RB', 'WR', 'TE', 'K', 'DEF']
 
     for position in positions:
         try:
-            # Fetch all players for this position (no query, just position filter)
-            players = api_client.search_players(query='', position=position)
+            # Fetch all players for this position (no query, just position filter);
+            # a forced refresh must not be answered from the client's caches
+            players = api_client.search_players(query='', position=position, use_cache=not force)
             all_players.extend(players)
             logger.info(f"Fetched {len(players)} {position} players")
         except Exception as e:
@@ -130,6 +139,29 @@ def search_cached_players(query, position=None, limit=20):
     Returns:
         List of matching players, sorted by relevance
     """
+    api_client = get_client()
+    index = _get_search_index(api_client, position)
+    if index is None:
+        return []
+    all_players = index['players']
+
+    # If no query, return first N players
+    if not query or len(query) < 2:
+        return all_players[:limit]
+
+    # Score and filter players (using existing fuzzy matching logic)
+    scored_players = api_client._score_and_filter_players(all_players, query, limit=limit, index=index)
+
+    return scored_players[:limit]
+
+def _get_search_index(api_client, position):
+    """Return a fresh search index for the position filter, building it if needed"""
+    now = time.monotonic()
+    with _search_indexes_lock:
+        entry = _search_indexes.get(position)
+    if entry and now - entry[0] < SEARCH_INDEX_TTL:
+        return entry[1]
+
     # Get cached players
     all_players = get_cached_players()
 
@@ -139,24 +171,20 @@ def search_cached_players(query, position=None, limit=20):
 
     if not all_players:
         logger.error("Failed to get player cache")
-        return []
+        return None
 
     # Filter by position if specified
     if position:
         all_players = [p for p in all_players if p.get('position') == position]
 
-    # If no query, return first N players
-    if not query or len(query) < 2:
-        return all_players[:limit]
-
-    # Score and filter players (using existing fuzzy matching logic)
-    from app.services.api_client import FantasyAPIClient
-    api_client = FantasyAPIClient()
-    scored_players = api_client._score_and_filter_players(all_players, query)
-
-    return scored_players[:limit]
+    index = api_client._build_search_index(all_players)
+    with _search_indexes_lock:
+        _search_indexes[position] = (now, index)
+    return index
 
 def refresh_player_cache():
     """Force refresh the player cache (call this from background job)"""
     logger.info("Forcing player cache refresh...")
+    with _search_indexes_lock:
+        _search_indexes.clear()
     return cache_all_players(force=True)
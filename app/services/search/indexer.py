@@ -7,6 +7,11 @@ from typing import List, Optional
 from app.services.api_client import FantasyAPIClient
 from app.services.search.search_engine import SearchEngine, SearchDocument, get_search_engine
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -198,16 +203,14 @@ class SearchIndexer:
         try:
             self.logger.info("Fetching teams from API...")
 
-            # Fetch teams directly from API endpoint
-            import requests
-            response = requests.get(
+            # Fetch teams directly from API endpoint, over the client's pooled session
+            response = self.api_client._session.get(
                 f'{self.api_client.base_url}/teams',
                 params={'limit': 100},
-                headers=self.api_client._get_headers(),
                 timeout=10
             )
             response.raise_for_status()
-            teams_data = response.json()
+            teams_data = _json_loads(response.content)
 
             if not teams_data or 'data' not in teams_data:
                 self.logger.error("No team data received from API")
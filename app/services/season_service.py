@@ -3,6 +3,11 @@ import os
 from datetime import datetime
 import logging
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,7 +68,7 @@ class SeasonService:
                     timeout=10
                 )
                 response.raise_for_status()
-                games = response.json().get('data', [])
+                games = _json_loads(response.content).get('data', [])
 
                 if games:
                     all_games[week] = games
@@ -89,7 +94,7 @@ class SeasonService:
                 timeout=5
             )
             response.raise_for_status()
-            data = response.json().get('data')
+            data = _json_loads(response.content).get('data')
 
             # Check for null or empty data
             if data is None:
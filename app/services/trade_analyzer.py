@@ -164,9 +164,12 @@ class TradeAnalyzer:
     def _get_players_data(self, player_ids: List[str]) -> List[Dict]:
         """Fetch data for multiple players"""
         players = []
-        for player_id in player_ids:
+        # Lookups are independent, so fetch them concurrently
+        responses = self.api_client.fetch_many(
+            (self.api_client.get_player_by_id_v2, (player_id,), {}) for player_id in player_ids
+        )
+        for player_id, response in zip(player_ids, responses):
             try:
-                response = self.api_client.get_player_by_id_v2(player_id)
                 if response and 'data' in response:
                     player_data = response['data']
                     player_data['trade_value'] = self._calculate_player_value(player_data)
@@ -64,6 +64,48 @@ def get_cached_or_fetch(key, fetch_func, expiry=3600):
         return fetch_func()
 
 
+def cache_get_json(key):
+    """
+    Get a JSON value from cache
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Decoded value, or None on a miss, an error, or when caching is disabled
+    """
+    if not CACHE_ENABLED:
+        return None
+
+    try:
+        cached = cache.get(key)
+        if cached:
+            logger.debug(f"Cache HIT for key: {key}")
+            return json.loads(cached)
+        logger.debug(f"Cache MISS for key: {key}")
+    except Exception as e:
+        logger.error(f"Cache read error for key {key}: {e}")
+    return None
+
+
+def cache_set_json(key, data, expiry=3600):
+    """
+    Store a JSON-serializable value in cache
+
+    Args:
+        key: Cache key
+        data: Value to store
+        expiry: Cache expiry in seconds (default 1 hour)
+    """
+    if not CACHE_ENABLED:
+        return
+
+    try:
+        cache.setex(key, expiry, json.dumps(data))
+    except Exception as e:
+        logger.error(f"Cache write error for key {key}: {e}")
+
+
 def cached_route(expiry=3600, key_prefix=''):
     """
     Decorator to cache Flask route responses
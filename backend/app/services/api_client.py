@@ -1,10 +1,26 @@
+"""
+Minimal Grid Iron Mind API client for the standalone backend service.
+
+This is not the application's main client: the Flask app under app/ uses
+app/services/api_client.py, which carries the relevance-scored player search
+(_score_and_filter_players) and the v2 endpoints. The two packages are deployed
+separately and never import each other.
+"""
 import requests
+from requests.adapters import HTTPAdapter
 import os
 
 class FantasyAPIClient:
     def __init__(self):
         self.base_url = os.getenv('API_BASE_URL', 'https://nfl.wearemachina.com/api/v1')
         self.api_key = os.getenv('API_KEY')
+        # Reuse connections across calls instead of a new TCP/TLS handshake
+        # per request; the headers never change, so set them once
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers.update(self._get_headers())
 
     def _get_headers(self, include_api_key=False):
         headers = {'Content-Type': 'application/json'}
@@ -14,10 +30,7 @@ class FantasyAPIClient:
 
     def get_player_data(self, player_id):
         """Get player details by ID"""
-        response = requests.get(
-            f'{self.base_url}/players/{player_id}',
-            headers=self._get_headers()
-        )
+        response = self._session.get(f'{self.base_url}/players/{player_id}')
         response.raise_for_status()
         return response.json()
 
@@ -27,38 +40,30 @@ class FantasyAPIClient:
         if position:
             params['position'] = position
 
-        response = requests.get(
+        response = self._session.get(
             f'{self.base_url}/players',
-            params=params,
-            headers=self._get_headers()
+            params=params
         )
         response.raise_for_status()
         return response.json().get('data', [])
 
     def get_defense_stats(self, team_id):
         """Get defensive statistics for a team"""
-        response = requests.get(
-            f'{self.base_url}/teams/{team_id}',
-            headers=self._get_headers()
-        )
+        response = self._session.get(f'{self.base_url}/teams/{team_id}')
         response.raise_for_status()
         return response.json()
 
     def get_weather_data(self, location):
         """Get current weather for a location"""
-        response = requests.get(
+        response = self._session.get(
             f'{self.base_url}/weather/current',
-            params={'location': location},
-            headers=self._get_headers()
+            params={'location': location}
         )
         response.raise_for_status()
         return response.json()
 
     def get_player_career_stats(self, player_id):
         """Get career statistics for a player"""
-        response = requests.get(
-            f'{self.base_url}/players/{player_id}/career',
-            headers=self._get_headers()
-        )
+        response = self._session.get(f'{self.base_url}/players/{player_id}/career')
         response.raise_for_status()
         return response.json()
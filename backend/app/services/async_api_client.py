@@ -110,13 +110,12 @@ class AsyncFantasyAPIClient:
         Returns:
             List of analysis results with player and defense data
         """
-        # Fetch all players concurrently
-        players = await self.get_multiple_players(player_ids)
-
-        # Fetch all defenses if opponents provided
-        defenses = []
+        # Fetch all players, and all defenses if opponents provided, concurrently
         if opponent_ids:
-            defenses = await self.get_multiple_defenses(opponent_ids)
+            players, defenses = await self.get_players_and_defenses(player_ids, opponent_ids)
+        else:
+            players = await self.get_multiple_players(player_ids)
+            defenses = []
 
         # Combine results
         results = []
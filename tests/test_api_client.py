@@ -0,0 +1,501 @@
+"""
+Unit tests for the main app's FantasyAPIClient (app/services/api_client.py)
+"""
+import ast
+import random
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import requests
+from flask import Flask, jsonify
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from app.services import api_client
+from app.services.api_client import (
+    FantasyAPIClient, _CircuitBreaker, _KeepAliveAdapter, _RequestMetrics, _TTLCache
+)
+
+API_CLIENT_PATH = Path(__file__).resolve().parent.parent / 'app' / 'services' / 'api_client.py'
+
+
+class TestFantasyAPIClientModule:
+    """The module must ship a single, full-featured client class"""
+
+    def test_defines_client_class_once(self):
+        """A second class FantasyAPIClient block would shadow the first"""
+        tree = ast.parse(API_CLIENT_PATH.read_text())
+        definitions = [node for node in tree.body
+                       if isinstance(node, ast.ClassDef) and node.name == 'FantasyAPIClient']
+        assert len(definitions) == 1
+
+    def test_client_has_advanced_search_scoring(self):
+        """search_players relies on the scoring/filtering path"""
+        assert callable(getattr(FantasyAPIClient, '_score_and_filter_players', None))
+
+
+class FakeClock:
+    """Stands in for the time module so breaker cooldowns pass instantly"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def perf_counter(self):
+        return self.now
+
+
+def make_response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b'{}'
+    return response
+
+
+def urllib3_response(status, headers):
+    return HTTPResponse(body=b'', headers=headers, status=status, preload_content=False)
+
+
+class TestCircuitBreaker:
+    """Breaker state transitions, driven through a fake adapter and clock"""
+
+    FAILURES = 3
+    RESET = 30
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        self.clock = FakeClock()
+        monkeypatch.setattr(api_client, 'time', self.clock)
+        # What the wrapped HTTPAdapter.send does next: a status code to
+        # answer with, or an exception to raise
+        self.outcomes = []
+        self.sent = 0
+
+        def fake_send(adapter, request, **kwargs):
+            self.sent += 1
+            outcome = self.outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return make_response(outcome)
+
+        monkeypatch.setattr(HTTPAdapter, 'send', fake_send)
+        self.breaker = _CircuitBreaker('test upstream', self.FAILURES, self.RESET)
+        self.adapter = _KeepAliveAdapter(breaker=self.breaker)
+        self.request = requests.Request('GET', 'https://api.example.com/api/v2/games/1').prepare()
+
+    def send(self, outcome):
+        self.outcomes.append(outcome)
+        return self.adapter.send(self.request)
+
+    def open_circuit(self):
+        for _ in range(self.FAILURES):
+            self.send(503)
+        assert self.breaker.state == 'open'
+
+    def test_opens_after_consecutive_5xx(self):
+        """Failures below the threshold keep the circuit closed"""
+        for _ in range(self.FAILURES - 1):
+            assert self.send(503).status_code == 503
+            assert self.breaker.state == 'closed'
+        self.send(503)
+        assert self.breaker.state == 'open'
+
+    def test_connection_errors_and_timeouts_count_as_failures(self):
+        """Transport errors are re-raised and counted toward the threshold"""
+        with pytest.raises(requests.ConnectionError):
+            self.send(requests.ConnectionError('refused'))
+        with pytest.raises(requests.Timeout):
+            self.send(requests.Timeout('read timed out'))
+        assert self.breaker.state == 'closed'
+        self.send(502)
+        assert self.breaker.state == 'open'
+
+    def test_client_errors_do_not_count(self):
+        """A 404 means the host is up, so it resets the failure count"""
+        for _ in range(self.FAILURES - 1):
+            self.send(503)
+        self.send(404)
+        for _ in range(self.FAILURES - 1):
+            self.send(503)
+        assert self.breaker.state == 'closed'
+
+    def test_fails_fast_while_open(self):
+        """No request reaches the transport until the cooldown passes"""
+        self.open_circuit()
+        sent = self.sent
+        self.clock.now += self.RESET - 1
+        for _ in range(5):
+            with pytest.raises(requests.ConnectionError):
+                self.adapter.send(self.request)
+        assert self.sent == sent
+
+    def test_half_open_lets_a_single_probe_through(self):
+        """After the cooldown one probe goes out while others keep failing"""
+        self.open_circuit()
+        self.clock.now += self.RESET
+        assert self.breaker.state == 'half-open'
+
+        # The probe claims the half-open slot before it is sent, so a
+        # concurrent caller is turned away without reaching the transport
+        self.breaker.check()
+        sent = self.sent
+        with pytest.raises(requests.ConnectionError):
+            self.adapter.send(self.request)
+        assert self.sent == sent
+
+    def test_failed_probe_reopens_circuit(self):
+        """A failing probe starts another full cooldown"""
+        self.open_circuit()
+        self.clock.now += self.RESET
+        self.send(503)
+        assert self.breaker.state == 'open'
+        self.clock.now += self.RESET - 1
+        with pytest.raises(requests.ConnectionError):
+            self.adapter.send(self.request)
+
+    def test_successful_probe_closes_and_resets(self):
+        """A success closes the circuit and clears the failure count"""
+        self.open_circuit()
+        self.clock.now += self.RESET
+        assert self.send(200).status_code == 200
+        assert self.breaker.state == 'closed'
+        for _ in range(self.FAILURES - 1):
+            self.send(503)
+        assert self.breaker.state == 'closed'
+
+
+class TestCoalesce:
+    """Single-flight sharing of in-flight lookups between threads"""
+
+    WAITERS = 5
+
+    def setup_method(self):
+        self.client = FantasyAPIClient()
+        self.fetches = 0
+        self.release = threading.Event()
+
+    def blocking_fetch(self, result=None, error=None):
+        def fetch():
+            self.fetches += 1
+            assert self.release.wait(5)
+            if error is not None:
+                raise error
+            return result
+        return fetch
+
+    def run_concurrently(self, fetch):
+        """Call _coalesce from several threads while the first fetch blocks"""
+        outcomes = [None] * self.WAITERS
+        started = threading.Barrier(self.WAITERS + 1)
+
+        def call(index):
+            started.wait()
+            try:
+                outcomes[index] = ('result', self.client._coalesce('key', fetch))
+            except Exception as e:
+                outcomes[index] = ('error', e)
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(self.WAITERS)]
+        for thread in threads:
+            thread.start()
+        started.wait()
+        # Give every caller time to find the in-flight Future before the
+        # owner's fetch is allowed to finish
+        time.sleep(0.2)
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        return outcomes
+
+    def test_concurrent_callers_share_one_fetch(self):
+        """Same key: one fetch, and every caller gets the same object"""
+        result = {'data': [1, 2, 3]}
+        outcomes = self.run_concurrently(self.blocking_fetch(result=result))
+        assert self.fetches == 1
+        assert all(kind == 'result' and value is result for kind, value in outcomes)
+
+    def test_owner_exception_reaches_every_waiter(self):
+        """A failed fetch raises the same exception in all callers"""
+        error = requests.ConnectionError('upstream down')
+        outcomes = self.run_concurrently(self.blocking_fetch(error=error))
+        assert self.fetches == 1
+        assert all(kind == 'error' and value is error for kind, value in outcomes)
+
+    def test_key_is_released_afterwards(self):
+        """Once the fetch finishes, a later call fetches again"""
+        self.release.set()
+        assert self.client._coalesce('key', self.blocking_fetch(result=1)) == 1
+        assert self.client._inflight == {}
+        assert self.client._coalesce('key', self.blocking_fetch(result=2)) == 2
+        assert self.fetches == 2
+
+    def test_key_is_released_after_failure(self):
+        """A failed fetch doesn't leave its key stuck in flight"""
+        self.release.set()
+        with pytest.raises(ValueError):
+            self.client._coalesce('key', self.blocking_fetch(error=ValueError('bad')))
+        assert self.client._inflight == {}
+        assert self.client._coalesce('key', self.blocking_fetch(result=3)) == 3
+
+
+def reference_levenshtein(s1, s2):
+    """Plain two-row DP, the definition the fast paths must match"""
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, 1):
+        current_row = [i]
+        for j, c2 in enumerate(s2, 1):
+            current_row.append(min(previous_row[j] + 1,
+                                   current_row[j - 1] + 1,
+                                   previous_row[j - 1] + (c1 != c2)))
+        previous_row = current_row
+    return previous_row[-1]
+
+
+class TestBitParallelDistance:
+    """The Myers/Hyyrö fallback, which only runs without rapidfuzz"""
+
+    # Small alphabets make near-matches (and so interesting DPs) common
+    ALPHABETS = ('ab', 'abcde', 'éèñüß', 'aé日本ö')
+    WORD_SIZE = FantasyAPIClient.BIT_PARALLEL_MAX_LEN
+    SAMPLES = 500
+
+    def setup_method(self):
+        self.client = FantasyAPIClient()
+        self.rng = random.Random(1234)
+
+    def random_string(self, max_len):
+        alphabet = self.rng.choice(self.ALPHABETS)
+        return ''.join(self.rng.choice(alphabet) for _ in range(self.rng.randint(0, max_len)))
+
+    def pairs(self):
+        yield from [('', ''), ('a', ''), ('', 'abc'), ('kelce', 'kelse'), ('smith', 'smtih')]
+        # Pattern lengths at and just past the 64-character word size
+        for length in (self.WORD_SIZE - 1, self.WORD_SIZE, self.WORD_SIZE + 1):
+            base = ''.join(self.rng.choice('abcé') for _ in range(length))
+            edited = list(base)
+            for _ in range(self.rng.randint(0, 4)):
+                edited[self.rng.randrange(length)] = self.rng.choice('abcé')
+            yield base, ''.join(edited)
+            yield base, base[1:]
+            yield base + 'x', base
+        for _ in range(self.SAMPLES):
+            yield self.random_string(12), self.random_string(12)
+        for _ in range(50):
+            yield self.random_string(self.WORD_SIZE + 8), self.random_string(self.WORD_SIZE + 8)
+
+    def test_matches_reference_distance(self):
+        """Unbounded distance equals the plain DP for non-empty patterns"""
+        for text, pattern in self.pairs():
+            if pattern:
+                assert (self.client._bit_parallel_distance(text, pattern)
+                        == reference_levenshtein(text, pattern)), (text, pattern)
+
+    def test_bounded_distance_caps_at_max_plus_one(self):
+        """With max_distance, larger distances are reported as max + 1"""
+        for text, pattern in self.pairs():
+            if not pattern:
+                continue
+            expected = reference_levenshtein(text, pattern)
+            for max_distance in (0, 1, 2, 5):
+                assert (self.client._bit_parallel_distance(text, pattern, max_distance)
+                        == min(expected, max_distance + 1)), (text, pattern, max_distance)
+
+    def test_fallback_levenshtein_without_rapidfuzz(self, monkeypatch):
+        """The full fallback (trimming, empties, >64 chars) matches too"""
+        monkeypatch.setattr(api_client, '_rf_levenshtein', None)
+        for s1, s2 in self.pairs():
+            expected = reference_levenshtein(s1, s2)
+            assert self.client._levenshtein_distance(s1, s2) == expected, (s1, s2)
+            assert self.client._levenshtein_distance(s1, s2, max_distance=2) == min(expected, 3), (s1, s2)
+
+
+class TestRequestMetrics:
+    """Per-endpoint stats served by /api/metrics/nfl-api"""
+
+    def setup_method(self):
+        self.metrics = _RequestMetrics()
+        self.request = requests.Request('GET', 'https://api.example.com/api/v2/players/42/history').prepare()
+
+    def test_endpoints_are_templated(self):
+        """IDs in the path collapse into one endpoint"""
+        other = requests.Request('GET', 'https://api.example.com/api/v2/players/7/history').prepare()
+        self.metrics.record(self.request, 0.02, status=200, nbytes=10)
+        self.metrics.record(other, 0.2, status=200, nbytes=30)
+        snapshot = self.metrics.snapshot()
+        assert list(snapshot) == ['GET /api/v2/players/:id/history']
+        entry = snapshot['GET /api/v2/players/:id/history']
+        assert entry['count'] == 2
+        assert entry['bytes'] == 40
+        assert entry['buckets']['0.05'] == 1
+        assert entry['buckets']['0.25'] == 1
+
+    def test_snapshot_with_statuses_and_errors_is_jsonifiable(self):
+        """Responses and transport errors on one endpoint still serialize"""
+        self.metrics.record(self.request, 0.01, status=200)
+        self.metrics.record(self.request, 0.01, status=404)
+        self.metrics.record(self.request, 3.05, error='ConnectTimeout')
+        snapshot = self.metrics.snapshot()
+        entry = snapshot['GET /api/v2/players/:id/history']
+        assert entry['statuses'] == {'200': 1, '404': 1}
+        assert entry['errors'] == {'ConnectTimeout': 1}
+
+        app = Flask(__name__)
+        with app.app_context():
+            body = jsonify(snapshot).get_json()
+        assert body['GET /api/v2/players/:id/history']['count'] == 3
+
+
+class TestAIBreakerIsolation:
+    """AI/garden failures must not open the host-wide circuit"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        # Breakers are process-wide; start from a clean registry
+        monkeypatch.setattr(api_client, '_breakers', {})
+        self.sent = []
+
+        def fake_send(adapter, request, **kwargs):
+            self.sent.append(request.url)
+            return make_response(503 if '/garden/' in request.url else 200)
+
+        monkeypatch.setattr(HTTPAdapter, 'send', fake_send)
+        self.client = FantasyAPIClient()
+
+    def test_garden_failures_leave_host_circuit_closed(self):
+        """Garden 503s open only the AI circuit; plain lookups still go out"""
+        for _ in range(FantasyAPIClient.AI_BREAKER_FAILURES):
+            assert self.client.ai_garden_query('best waiver pickups') is None
+        assert self.client.health() == {'api': 'closed', 'ai': 'open'}
+
+        sent = len(self.sent)
+        self.client.get_game_details_v2('game-1')
+        assert len(self.sent) == sent + 1
+        assert self.client.health()['api'] == 'closed'
+
+
+class TestTTLCache:
+    """The bounded TTL cache behind the client's in-process caches"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        self.clock = FakeClock()
+        monkeypatch.setattr(api_client, 'time', self.clock)
+
+    def test_entries_expire_after_ttl(self):
+        """Default and per-entry TTLs are honored; None means no expiry"""
+        cache = _TTLCache(maxsize=10, ttl=60)
+        cache.set('default', 1)
+        cache.set('short', 2, ttl=5)
+        forever = _TTLCache(maxsize=10)
+        forever.set('key', 3)
+        self.clock.now += 5
+        assert cache.get('short') is None
+        assert cache.get('default') == 1
+        self.clock.now += 55
+        assert cache.get('default') is None
+        assert forever.get('key') == 3
+
+    def test_evicts_oldest_when_full(self):
+        """Setting a key again makes it the newest entry"""
+        cache = _TTLCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('a', 10)
+        cache.set('c', 3)
+        assert cache.get('b') is None
+        assert (cache.get('a'), cache.get('c')) == (10, 3)
+
+    def test_get_or_load_loads_once_until_expiry(self):
+        """Hits skip the loader; a None result is not stored"""
+        cache = _TTLCache(maxsize=10, ttl=60)
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return len(loads)
+
+        assert cache.get_or_load('key', loader) == 1
+        assert cache.get_or_load('key', loader) == 1
+        self.clock.now += 60
+        assert cache.get_or_load('key', loader) == 2
+        assert cache.get_or_load('none', lambda: None) is None
+        assert cache.get_or_load('none', loader) == 3
+
+    def test_discard_by_predicate(self):
+        """discard() drops matching keys, or everything without a predicate"""
+        cache = _TTLCache(maxsize=10)
+        for key in ('players/1', 'players/2', 'games/1'):
+            cache.set(key, key)
+        cache.discard(lambda key: key.startswith('players/'))
+        assert cache.get('players/1') is None
+        assert cache.get('games/1') == 'games/1'
+        cache.discard()
+        assert cache.get('games/1') is None
+
+
+class TestNotFoundCache:
+    """Remembered 404s for by-ID player lookups"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        monkeypatch.setattr(api_client, '_shared_caches', {})
+        monkeypatch.setattr(api_client, '_breakers', {})
+        self.sent = []
+
+        def fake_send(adapter, request, **kwargs):
+            self.sent.append(request.url)
+            response = make_response(404)
+            response.url = request.url
+            return response
+
+        monkeypatch.setattr(HTTPAdapter, 'send', fake_send)
+        self.client = FantasyAPIClient()
+
+    def test_missing_player_is_not_refetched(self):
+        """A 404 is remembered, across clients, until invalidated"""
+        assert self.client.get_player_data('retired-1') is None
+        assert self.client.get_player_data('retired-1') is None
+        assert FantasyAPIClient().get_player_data('retired-1') is None
+        assert len(self.sent) == 1
+
+        self.client.invalidate_missing('other-id')
+        self.client.get_player_data('retired-1')
+        assert len(self.sent) == 1
+
+        FantasyAPIClient().invalidate_missing('retired-1')
+        self.client.get_player_data('retired-1')
+        assert len(self.sent) == 2
+
+
+class TestRetryPolicy:
+    """Retry sleeps stay bounded for synchronous request paths"""
+
+    def setup_method(self):
+        self.retry = FantasyAPIClient()._build_retry(FantasyAPIClient.MAX_RETRIES)
+
+    def test_caps_survive_retry_increments(self):
+        """Retry.new() rebuilds the object on every retry; the caps must carry over"""
+        retried = self.retry.increment(method='GET', url='/games/1', error=requests.ConnectionError())
+        assert isinstance(retried, api_client._BoundedRetry)
+        retried.history = retried.history * 20
+        assert retried.get_backoff_time() <= api_client._BoundedRetry.DEFAULT_BACKOFF_MAX
+
+    def test_long_retry_after_is_capped(self, monkeypatch):
+        """A 429 asking for an hour waits at most RETRY_AFTER_MAX seconds"""
+        response = urllib3_response(429, {'Retry-After': '3600'})
+        sleeps = []
+        monkeypatch.setattr('urllib3.util.retry.time.sleep', sleeps.append)
+        assert self.retry.sleep_for_retry(response)
+        assert sleeps == [api_client._BoundedRetry.RETRY_AFTER_MAX]
+
+    def test_short_retry_after_is_honored(self, monkeypatch):
+        """Retry-After values under the cap are used as sent"""
+        response = urllib3_response(429, {'Retry-After': '2'})
+        sleeps = []
+        monkeypatch.setattr('urllib3.util.retry.time.sleep', sleeps.append)
+        self.retry.sleep_for_retry(response)
+        assert sleeps == [2]